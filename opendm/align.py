@@ -136,12 +136,16 @@ def transform_obj(input_obj, a_matrix, geo_offset, output_obj):
     g_off = np.array([geo_offset[0], geo_offset[1], 0, 0])
 
     with open(input_obj, 'r') as fin:
-        with open(output_obj, 'w') as fout:
-            lines = fin.readlines()
-            for line in lines:
-                if line.startswith("v "):
-                    v = np.fromstring(line.strip()[2:] + " 1",  sep=' ', dtype=float)
-                    vt = (a_matrix.dot((v + g_off)) - g_off)[:3]
-                    fout.write("v " + " ".join(map(str, list(vt))) + '\n')
-                else:
-                    fout.write(line)
\ No newline at end of file
+        lines = fin.readlines()
+
+    # Parse and transform all vertices at once
+    v_idx = [i for i, line in enumerate(lines) if line.startswith("v ")]
+    if v_idx:
+        v = np.ones((len(v_idx), 4), dtype=float)
+        v[:, :3] = np.array([lines[i].split()[1:4] for i in v_idx], dtype=float)
+        vt = ((v + g_off) @ a_matrix.T - g_off)[:, :3]
+        for i, t in zip(v_idx, vt.tolist()):
+            lines[i] = "v " + " ".join(map(str, t)) + '\n'
+
+    with open(output_obj, 'w') as fout:
+        fout.writelines(lines)
\ No newline at end of file
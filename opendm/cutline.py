@@ -86,6 +86,7 @@ def compute_cutline(orthophoto_file, crop_area_file, destination, max_concurrenc
 
         # Compute canny edges on first band
         edges = canny(rast)
+        del rast # Not needed anymore, free it before allocating cost maps
 
         def compute_linestrings(direction):
             log.ODM_INFO("Computing %s cutlines" % direction)
@@ -93,7 +94,7 @@ def compute_cutline(orthophoto_file, crop_area_file, destination, max_concurrenc
             cost_map = np.full((height, width), 1, dtype=np.float32)
 
             # Write edges to cost map
-            cost_map[edges==True] = 0 # Low cost
+            cost_map[edges] = 0 # Low cost
 
             # Write "barrier, floor is lava" costs
             if direction == 'vertical':
@@ -113,8 +113,7 @@ def create_dem(input_point_cloud, dem_type, output_type='max', radiuses=['0.56']
     tiles_vrt_path = os.path.abspath(os.path.join(outdir, "tiles.vrt"))
     tiles_file_list = os.path.abspath(os.path.join(outdir, "tiles_list.txt"))
     with open(tiles_file_list, 'w') as f:
-        for t in tiles:
-            f.write(t['filename'] + '\n')
+        f.writelines(t['filename'] + '\n' for t in tiles)
 
     run('gdalbuildvrt -input_file_list "%s" "%s" ' % (tiles_file_list, tiles_vrt_path))
 
@@ -36,7 +36,6 @@ import json as jsonlib
 import tempfile
 from opendm import system
 from opendm import log
-from opendm.utils import double_quote
 
 from datetime import datetime
 
@@ -146,9 +145,9 @@ def run_pipeline(json):
     cmd = [
         'pdal',
         'pipeline',
-        '-i %s' % double_quote(jsonfile)
+        '-i', jsonfile
     ]
-    system.run(' '.join(cmd))
+    system.run(cmd)
     os.remove(jsonfile)
 
 
@@ -157,8 +156,8 @@ def run_pdaltranslate_smrf(fin, fout, scalar, slope, threshold, window):
     cmd = [
         'pdal',
         'translate',
-        '-i %s' % fin,
-        '-o %s' % fout,
+        '-i', fin,
+        '-o', fout,
         'smrf',
         '--filters.smrf.scalar=%s' % scalar,
         '--filters.smrf.slope=%s' % slope,
@@ -166,7 +165,7 @@ def run_pdaltranslate_smrf(fin, fout, scalar, slope, threshold, window):
         '--filters.smrf.window=%s' % window,
     ]
 
-    system.run(' '.join(cmd))
+    system.run(cmd)
 
 
 def merge_point_clouds(input_files, output_file):
@@ -177,18 +176,17 @@ def merge_point_clouds(input_files, output_file):
     cmd = [
         'pdal',
         'merge',
-        ' '.join(map(double_quote, input_files + [output_file])),
-    ]
+    ] + input_files + [output_file]
 
-    system.run(' '.join(cmd))
+    system.run(cmd)
 
 
 def translate(input, output):
     cmd = [
         'pdal',
         'translate',
-        '-i "%s"' % input,
-        '-o "%s"' % output,
+        '-i', input,
+        '-o', output,
     ]
 
-    system.run(' '.join(cmd))
\ No newline at end of file
+    system.run(cmd)
\ No newline at end of file
@@ -1,4 +1,3 @@
-import glob
 import os
 from opendm import log
 from opendm import location
@@ -142,11 +141,12 @@ class GCPFile:
 
         return gcp_file_output
 
-    def make_filtered_copy(self, gcp_file_output, images_dir, min_images=3):
+    def make_filtered_copy(self, gcp_file_output, images_dir, min_images=3, image_names=None):
         """
         Creates a new GCP file from an existing GCP file includes
         only the points that reference images existing in the images_dir directory.
         If less than min_images images are referenced, no GCP copy is created.
+        :param image_names optional set of filenames in images_dir, if the caller already listed it
         :return gcp_file_output if successful, None if no output file was created.
         """
         if not self.exists() or not os.path.exists(images_dir):
@@ -155,7 +155,10 @@ class GCPFile:
         if os.path.exists(gcp_file_output):
             os.remove(gcp_file_output)
 
-        files = list(map(os.path.basename, glob.glob(os.path.join(images_dir, "*"))))
+        if image_names is not None:
+            files = image_names
+        else:
+            files = {f for f in os.listdir(images_dir) if not f.startswith(".")}
 
         output = [self.raw_srs]
         files_found = 0
@@ -22,6 +22,9 @@ class GeoFile:
             self.srs = location.parse_srs_header(self.raw_srs)
             longlat = CRS.from_epsg("4326")
 
+            # Same transformation for every entry, build it once
+            to_longlat = location.transformer(self.srs, longlat)
+
             for line in lines[1:]:
                 if line != "" and line[0] != "#":
                     parts = line.split()
@@ -33,9 +36,9 @@ class GeoFile:
 
                         # Always convert coordinates to WGS84
                         if z is not None:
-                            x, y, z = location.transform3(self.srs, longlat, x, y, z)
+                            x, y, z = to_longlat.TransformPoint(x, y, z)
                         else:
-                            x, y = location.transform2(self.srs, longlat, x, y)
+                            x, y = to_longlat.TransformPoint(x, y, 0)[:2]
 
                         yaw = pitch = roll = None
 
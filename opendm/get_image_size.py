@@ -8,14 +8,16 @@ Image.MAX_IMAGE_PIXELS = None
 def get_image_size(file_path, fallback_on_error=True):
     """
     Return (width, height) for a given img file
+    :param file_path path to the image, or an already opened binary file object
     """
     try:
         with Image.open(file_path) as img:
             width, height = img.size
     except Exception as e:
         if fallback_on_error:
-            log.ODM_WARNING("Cannot read %s with PIL, fallback to cv2: %s" % (file_path, str(e)))
-            img = cv2.imread(file_path)
+            path = getattr(file_path, 'name', file_path)
+            log.ODM_WARNING("Cannot read %s with PIL, fallback to cv2: %s" % (path, str(e)))
+            img = cv2.imread(path)
             width = img.shape[1]
             height = img.shape[0]
         else:
@@ -35,12 +35,12 @@ def load_obj(obj_path, _info=print):
                 obj['materials'].update(load_mtl(mtl_file, obj_base_path, _info=_info))
             elif line.startswith("v "):
                 # Vertices
-                vertices.append(list(map(float, line.split()[1:4])))
+                vertices.append(line)
             elif line.startswith("vt "):
                 # UVs
-                uvs.append(list(map(float, line.split()[1:3])))
+                uvs.append(line)
             elif line.startswith("vn "):
-                normals.append(list(map(float, line.split()[1:4])))
+                normals.append(line)
             elif line.startswith("usemtl "):
                 mtl_name = "".join(line.split()[1:]).strip()
                 if not mtl_name in obj['materials']:
@@ -65,15 +65,24 @@ def load_obj(obj_path, _info=print):
                     cv, ct = map(int, c.split("/")[0:2])
                     faces[current_material].append((av - 1, bv - 1, cv - 1, at - 1, bt - 1, ct - 1)) 
 
-    obj['vertices'] = np.array(vertices, dtype=np.float32)
-    obj['uvs'] = np.array(uvs, dtype=np.float32)
-    obj['normals'] = np.array(normals, dtype=np.float32)
+    obj['vertices'] = parse_values(vertices, 3)
+    obj['uvs'] = parse_values(uvs, 2)
+    obj['normals'] = parse_values(normals, 3)
     obj['faces'] = faces
 
     obj['materials'] = convert_materials_to_jpeg(obj['materials'])
 
     return obj
 
+def parse_values(lines, count):
+    """
+    Parse the first count values following the keyword
+    of each line (e.g. "v x y z") into a float32 array
+    """
+    if not lines:
+        return np.array([], dtype=np.float32)
+    return np.loadtxt(lines, usecols=range(1, count + 1), ndmin=2).astype(np.float32)
+
 def convert_materials_to_jpeg(materials):
 
     min_value = 0
@@ -165,7 +174,7 @@ def obj2glb(input_obj, output_glb, rtc=(None, None), draco_compression=True, _in
     uvs = (([0, 1] - (uvs * [0, 1])) + uvs * [1, 0]).astype(np.float32)
     normals = obj['normals']
 
-    binary = b''
+    blobs = []
     accessors = []
     bufferViews = []
     primitives = []
@@ -176,6 +185,7 @@ def obj2glb(input_obj, output_glb, rtc=(None, None), draco_compression=True, _in
     bufOffset = 0
     def addBufferView(buf, target=None):
         nonlocal bufferViews, bufOffset
+        blobs.append(buf)
         bufferViews += [pygltflib.BufferView(
             buffer=0,
             byteOffset=bufOffset,
@@ -202,10 +212,6 @@ def obj2glb(input_obj, output_glb, rtc=(None, None), draco_compression=True, _in
         vertices_blob = prim_vertices.tobytes()
         uvs_blob = prim_uvs.tobytes()
 
-        binary += vertices_blob + uvs_blob
-        if normals_blob is not None:
-            binary += normals_blob
-        
         verticesBufferView = addBufferView(vertices_blob, pygltflib.ARRAY_BUFFER)
         uvsBufferView = addBufferView(uvs_blob, pygltflib.ARRAY_BUFFER)
         normalsBufferView = None
@@ -249,7 +255,6 @@ def obj2glb(input_obj, output_glb, rtc=(None, None), draco_compression=True, _in
 
     for material in obj['faces'].keys():
         texture_blob = paddedBuffer(obj['materials'][material], 4)
-        binary += texture_blob
         textureBufferView = addBufferView(texture_blob)
 
         images += [pygltflib.Image(bufferView=textureBufferView, mimeType="image/jpeg")]
@@ -262,6 +267,9 @@ def obj2glb(input_obj, output_glb, rtc=(None, None), draco_compression=True, _in
         }
         materials += [mat]
 
+    # Buffer views are laid out in the order they were added
+    binary = b''.join(blobs)
+
     gltf = pygltflib.GLTF2(
         scene=0,
         scenes=[pygltflib.Scene(nodes=[0])],
@@ -299,10 +307,9 @@ def obj2glb(input_obj, output_glb, rtc=(None, None), draco_compression=True, _in
         _info("Compressing with draco")
         try:
             compressed_glb = io.related_file_path(output_glb, postfix="_compressed")
-            system.run('draco_transcoder -i "{}" -o "{}" -qt 16 -qp 16'.format(output_glb, compressed_glb))
+            system.run(['draco_transcoder', '-i', output_glb, '-o', compressed_glb, '-qt', '16', '-qp', '16'])
             if os.path.isfile(compressed_glb) and os.path.isfile(output_glb):
-                os.remove(output_glb)
-                os.rename(compressed_glb, output_glb)
+                os.replace(compressed_glb, output_glb)
         except Exception as e:
             log.ODM_WARNING("Cannot compress GLB with draco: %s" % str(e))
             
@@ -32,18 +32,14 @@ def image_max_size(photos, target_resolution, reconstruction_json, gsd_error_est
     :return A dimension in pixels calculated by taking the image_scale_factor and applying it to the size of the largest image.
         Returned value is never higher than the size of the largest side of the largest image.
     """
-    max_width = 0
-    max_height = 0
     if ignore_gsd:
         isf = 1.0
     else:
         isf = image_scale_factor(target_resolution, reconstruction_json, gsd_error_estimate, has_gcp=has_gcp)
 
-    for p in photos:
-        max_width = max(p.width, max_width)
-        max_height = max(p.height, max_height)
+    max_dim = max((max(p.width, p.height) for p in photos), default=0)
 
-    return int(math.ceil(max(max_width, max_height) * isf))
+    return int(math.ceil(max_dim * isf))
 
 def image_scale_factor(target_resolution, reconstruction_json, gsd_error_estimate = 0.5, has_gcp=False):
     """
@@ -1,6 +1,9 @@
 import os
 import shutil, errno
 import json
+import glob
+import threading
+from opendm import system
 
 def absolute_path_file(path_file):
     return os.path.abspath(path_file)
@@ -25,12 +28,41 @@ def dir_exists(dirname):
 
 
 def copy(src, dst):
-    try:
+    if os.path.isdir(src):
         shutil.copytree(src, dst)
-    except OSError as e:
-        if e.errno == errno.ENOTDIR:
-            shutil.copy(src, dst)
-        else: raise
+    else:
+        # shutil uses os.sendfile for file to file copies on Linux
+        shutil.copy(src, dst)
+
+rmtree_threads = []
+
+def async_rmtree(path):
+    """
+    Move a directory out of the way and delete it in the background.
+    Leftovers of deletes that were interrupted in a previous run are removed first.
+    Pending deletes are waited for on exit, see join_rmtree_threads.
+    """
+    path = path.rstrip(os.sep)
+    for stale in glob.glob(glob.escape(path) + ".trash.*"):
+        shutil.rmtree(stale, ignore_errors=True)
+
+    trash = "%s.trash.%s" % (path, os.getpid())
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path)
+        return
+
+    t = threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={'ignore_errors': True})
+    rmtree_threads.append(t)
+    t.start()
+
+def join_rmtree_threads():
+    while rmtree_threads:
+        rmtree_threads.pop().join()
+
+# os._exit on TERM/INT does not wait for threads
+system.add_cleanup_callback(join_rmtree_threads)
 
 def rename_file(src, dst):
     try:
@@ -45,8 +77,13 @@ def rename_file(src, dst):
 
 # find a file in the root directory
 def find(filename, folder):
-    for root, dirs, files in os.walk(folder):
-        return '/'.join((root, filename)) if filename in files else None
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.name == filename and not entry.is_dir():
+                    return '/'.join((folder, filename))
+    except OSError:
+        pass
 
 
 def related_file_path(input_file_path, prefix="", postfix="", replace_base=None):
@@ -1,53 +1,47 @@
 import math
+import numpy as np
 from opendm import log
 from pyproj import Proj, Transformer, CRS
 from osgeo import osr
+from repoze.lru import lru_cache
 
-def extract_utm_coords(photos, images_path, output_coords_file):
+def extract_utm_coords(photo_arrays, images_path, output_coords_file):
     """
     Create a coordinate file containing the GPS positions of all cameras 
     to be used later in the ODM toolchain for automatic georeferecing
-    :param photos ([ODM_Photo]) list of photos
+    :param photo_arrays (dict) columnar photo fields, see ODM_Reconstruction.as_arrays
     :param images_path (str) path to dataset images
     :param output_coords_file (str) path to output coordinates file
     :return None
     """
-    if len(photos) == 0:
+    filenames, lats, lons = photo_arrays['filename'], photo_arrays['lat'], photo_arrays['lon']
+    if len(filenames) == 0:
         raise Exception("No input images, cannot create coordinates file of GPS positions")
     
-    utm_zone = None
-    hemisphere = None
-    coords = []
-    reference_photo = None
-    for photo in photos:
-        if photo.latitude is None or photo.longitude is None:
-            log.ODM_WARNING("GPS position not available for %s" % photo.filename)
-            continue
-        
-        if utm_zone is None:
-            utm_zone, hemisphere = get_utm_zone_and_hemisphere_from(photo.longitude, photo.latitude)
-
-        try:
-            alt = photo.altitude if photo.altitude is not None else 0
-            coord = convert_to_utm(photo.longitude, photo.latitude, alt, utm_zone, hemisphere)
-        except:
-            raise Exception("Failed to convert GPS position to UTM for %s" % photo.filename)
-        
-        coords.append(coord)
-
-    if utm_zone is None:
+    geotagged = ~(np.isnan(lats) | np.isnan(lons))
+    for filename in filenames[~geotagged]:
+        log.ODM_WARNING("GPS position not available for %s" % filename)
+
+    if not np.any(geotagged):
         raise Exception("No images seem to have GPS information")
-        
-    # Calculate average
-    dx = 0.0
-    dy = 0.0
-    num = float(len(coords))
-    for coord in coords:
-        dx += coord[0] / num
-        dy += coord[1] / num
 
-    dx = int(math.floor(dx))
-    dy = int(math.floor(dy))
+    filenames, lats, lons = filenames[geotagged], lats[geotagged], lons[geotagged]
+    alts = [a if not math.isnan(a) else 0 for a in photo_arrays['alt'][geotagged].tolist()]
+
+    utm_zone, hemisphere = get_utm_zone_and_hemisphere_from(float(lons[0]), float(lats[0]))
+
+    # Project all positions with a single call
+    xs, ys = utm_proj(utm_zone, hemisphere)(lons, lats)
+
+    invalid = ~(np.isfinite(xs) & np.isfinite(ys))
+    if np.any(invalid):
+        raise Exception("Failed to convert GPS position to UTM for %s" % filenames[int(np.argmax(invalid))])
+
+    coords = [[x, y, alt] for x, y, alt in zip(xs.tolist(), ys.tolist(), alts)]
+
+    # Calculate average
+    dx = int(math.floor(np.mean(xs)))
+    dy = int(math.floor(np.mean(ys)))
 
     # Open output file
     with open(output_coords_file, "w") as f:
@@ -105,13 +99,21 @@ def convert_to_utm(lon, lat, alt, utm_zone, hemisphere):
     :param hemisphere one of 'N' or 'S'
     :return [x,y,z] UTM coordinates
     """
+    x,y = utm_proj(utm_zone, hemisphere)(lon, lat)
+    return [x, y, alt]
+
+@lru_cache(maxsize=None)
+def utm_proj(utm_zone, hemisphere):
+    """
+    :param utm_zone UTM zone number
+    :param hemisphere one of 'N' or 'S'
+    :return Proj object for the UTM zone (cached, since all photos in a dataset
+        typically share the same zone)
+    """
     if hemisphere == 'N':
-        p = Proj(proj='utm',zone=utm_zone,ellps='WGS84', preserve_units=True)
+        return Proj(proj='utm',zone=utm_zone,ellps='WGS84', preserve_units=True)
     else:
-        p = Proj(proj='utm',zone=utm_zone,ellps='WGS84', preserve_units=True, south=True)
-    
-    x,y = p(lon, lat)
-    return [x, y, alt]
+        return Proj(proj='utm',zone=utm_zone,ellps='WGS84', preserve_units=True, south=True)
 
 def parse_srs_header(header):
     """
@@ -125,19 +127,11 @@ def parse_srs_header(header):
     try:
         if ref[0] == 'WGS84' and ref[1] == 'UTM':
             datum = ref[0]
-            utm_pole = (ref[2][len(ref[2]) - 1]).upper()
-            utm_zone = int(ref[2][:len(ref[2]) - 1])
-            
-            proj_args = {
-                'zone': utm_zone, 
-                'datum': datum
-            }
-
-            proj4 = '+proj=utm +zone={zone} +datum={datum} +units=m +no_defs=True'
-            if utm_pole == 'S':
-                proj4 += ' +south=True'
-
-            srs = CRS.from_proj4(proj4.format(**proj_args))
+            utm_pole = ref[2][-1].upper()
+            utm_zone = int(ref[2][:-1])
+
+            proj4 = f"+proj=utm +zone={utm_zone} +datum={datum} +units=m +no_defs=True{' +south=True' if utm_pole == 'S' else ''}"
+            srs = CRS.from_proj4(proj4)
         elif '+proj' in header:
             srs = CRS.from_proj4(header.strip('\''))
         elif header.lower().startswith("epsg:"):
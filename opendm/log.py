@@ -121,17 +121,19 @@ class ODMLogger:
                 start_time = dateutil.parser.isoparse(last_stage['startTime'])
                 last_stage['totalTime'] = round((end_time - start_time).total_seconds(), 2)
             
-    def info(self, msg):
-        self.log(DEFAULT, msg, "INFO")
+    # Messages can be given printf-style arguments, like the stdlib logging API.
+    # Every message is emitted, so the arguments are always formatted
+    def info(self, msg, *args):
+        self.log(DEFAULT, msg % args if args else msg, "INFO")
 
-    def warning(self, msg):
-        self.log(WARNING, msg, "WARNING")
+    def warning(self, msg, *args):
+        self.log(WARNING, msg % args if args else msg, "WARNING")
 
-    def error(self, msg):
-        self.log(FAIL, msg, "ERROR")
+    def error(self, msg, *args):
+        self.log(FAIL, msg % args if args else msg, "ERROR")
 
-    def exception(self, msg):
-        self.log(FAIL, msg, "EXCEPTION")
+    def exception(self, msg, *args):
+        self.log(FAIL, msg % args if args else msg, "EXCEPTION")
 
     def close(self):
         if self.json is not None and self.json_output_file is not None:
@@ -6,6 +6,7 @@ from opendm import dls
 import numpy as np
 from opendm import log
 from opendm.concurrency import parallel_map
+from repoze.lru import lru_cache
 from opensfm.io import imread
 
 from skimage import exposure
@@ -40,7 +41,7 @@ def dn_to_radiance(photo, image):
 
     V, x, y = vignette_map(photo)
     if x is None:
-        x, y = np.meshgrid(np.arange(photo.width), np.arange(photo.height))
+        x, y = pixel_grid(photo.width, photo.height)
 
     if dark_level is not None:
         image -= dark_level
@@ -54,18 +55,16 @@ def dn_to_radiance(photo, image):
     
     if V is not None:
         # vignette correction
-        V = np.repeat(V[:, :, np.newaxis], image.shape[2], axis=2)
-        image *= V
+        image *= V[:, :, np.newaxis]
 
     if exposure_time and a2 is not None and a3 is not None:
         # row gradient correction
         R = 1.0 / (1.0 + a2 * y / exposure_time - a3 * y)
-        R = np.repeat(R[:, :, np.newaxis], image.shape[2], axis=2)
-        image *= R
+        image *= R[:, :, np.newaxis]
     
     # Floor any negative radiances to zero (can happen due to noise around blackLevel)
     if dark_level is not None:
-        image[image < 0] = 0
+        np.maximum(image, 0, out=image)
     
     # apply the radiometric calibration - i.e. scale by the gain-exposure product and
     # multiply with the radiometric calibration coefficient
@@ -87,39 +86,66 @@ def vignette_map(photo):
     polynomial = photo.get_vignetting_polynomial()
 
     if x_vc and polynomial:
-        # append 1., so that we can call with numpy polyval
-        polynomial.append(1.0)
-        vignette_poly = np.array(polynomial)
+        # Photos of the same band share vignetting parameters,
+        # so the (cached) map is computed once per band
+        vignette = compute_vignette(photo.width, photo.height, x_vc, y_vc, tuple(polynomial), photo.camera_make == "DJI")
+        x, y = pixel_grid(photo.width, photo.height)
+        return vignette, x, y
+    
+    return None, None, None
+
+@lru_cache(maxsize=4)
+def pixel_grid(width, height):
+    """
+    :return (read-only) x (1 x width), y (height x 1) coordinate grids
+        for an image of width x height pixels, they broadcast to the full grid
+    """
+    x, y = np.meshgrid(np.arange(width), np.arange(height), sparse=True)
+    x.setflags(write=False)
+    y.setflags(write=False)
+    return x, y
+
+@lru_cache(maxsize=16)
+def compute_vignette(width, height, x_vc, y_vc, polynomial, is_dji):
+    """
+    :return (read-only) vignette correction map, such that
+        image_corrected = image_original * vignette
+    """
+    # append 1., so that we can call with numpy polyval
+    vignette_poly = np.array(polynomial + (1.0, ))
 
-        # perform vignette correction
-        # get coordinate grid across image
-        x, y = np.meshgrid(np.arange(photo.width), np.arange(photo.height))
+    # perform vignette correction
+    # get coordinate grid across image
+    x, y = pixel_grid(width, height)
 
-        # meshgrid returns transposed arrays
-        # x = x.T
-        # y = y.T
+    # compute matrix of distances from image center
+    r = np.hypot((x - x_vc), (y - y_vc))
 
-        # compute matrix of distances from image center
-        r = np.hypot((x - x_vc), (y - y_vc))
+    # compute the vignette polynomial for each distance - we divide by the polynomial so that the
+    # corrected image is image_corrected = image_original * vignetteCorrection
+    vignette = np.polyval(vignette_poly, r)
 
-        # compute the vignette polynomial for each distance - we divide by the polynomial so that the
-        # corrected image is image_corrected = image_original * vignetteCorrection
-        vignette = np.polyval(vignette_poly, r)
+    # DJI is special apparently
+    if not is_dji:
+        vignette = 1.0 / vignette
 
-        # DJI is special apparently
-        if photo.camera_make != "DJI":
-            vignette = 1.0 / vignette
+    vignette = vignette.astype(np.float32)
+    vignette.setflags(write=False)
+    return vignette
 
-        return vignette, x, y
-    
-    return None, None, None
+def clear_caches():
+    """
+    Release the cached vignette maps and pixel grids
+    (call once images have been calibrated)
+    """
+    compute_vignette._cache.clear()
+    pixel_grid._cache.clear()
 
 def dn_to_reflectance(photo, image, use_sun_sensor=True):
     radiance = dn_to_radiance(photo, image)
     irradiance = compute_irradiance(photo, use_sun_sensor=use_sun_sensor)
     reflectance = radiance * math.pi / irradiance
-    reflectance[reflectance < 0.0] = 0.0
-    reflectance[reflectance > 1.0] = 1.0
+    np.clip(reflectance, 0.0, 1.0, out=reflectance)
     return reflectance
 
 def compute_irradiance(photo, use_sun_sensor=True):
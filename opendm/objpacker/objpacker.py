@@ -40,8 +40,8 @@ def load_obj(obj_path, _info=print):
             #     # Vertices
             #     vertices.append(list(map(float, line.split()[1:4])))
             elif line.startswith("vt "):
-                # UVs
-                uvs.append(list(map(float, line.split()[1:3])))
+                # UVs (parsed all at once below)
+                uvs.append(line)
             # elif line.startswith("vn "):
             #     normals.append(list(map(float, line.split()[1:4])))
             elif line.startswith("usemtl "):
@@ -60,7 +60,10 @@ def load_obj(obj_path, _info=print):
                 ct = int(c.split("/")[1])
                 faces[current_material].append((at - 1, bt - 1, ct - 1)) 
 
-    obj['uvs'] = np.array(uvs, dtype=np.float32)
+    if uvs:
+        obj['uvs'] = np.loadtxt(uvs, usecols=(1, 2), ndmin=2).astype(np.float32)
+    else:
+        obj['uvs'] = np.array(uvs, dtype=np.float32)
     obj['faces'] = faces
 
     return obj
@@ -19,8 +19,7 @@ def classify(point_cloud, max_threads=8):
             run('pcclassify "%s" "%s" "%s" -u -s 2,64' % (point_cloud, tmp_output, model), env_vars={'OMP_NUM_THREADS': max_threads})
             
             if os.path.isfile(tmp_output):
-                os.remove(point_cloud)
-                os.rename(tmp_output, point_cloud)
+                os.replace(tmp_output, point_cloud)
             else:
                 log.ODM_WARNING("Cannot classify using OpenPointClass (no output generated)")
         else:
@@ -27,14 +27,18 @@ def get_orthophoto_vars(args):
         'NUM_THREADS': args.max_concurrency
     }
 
-def build_overviews(orthophoto_file):
+def build_overviews(orthophoto_file, max_workers=1):
     log.ODM_INFO("Building Overviews")
-    kwargs = {'orthophoto': orthophoto_file}
+    kwargs = {
+        'orthophoto': orthophoto_file,
+        'threads': max_workers if max_workers else 'ALL_CPUS',
+    }
     
     # Run gdaladdo
     system.run('gdaladdo -r average '
                 '--config BIGTIFF_OVERVIEW IF_SAFER '
                 '--config COMPRESS_OVERVIEW JPEG '
+                '--config GDAL_NUM_THREADS {threads} '
                 '{orthophoto} 2 4 8 16'.format(**kwargs))
 
 def generate_png(orthophoto_file, output_file=None, outsize=None):
@@ -90,7 +94,7 @@ def post_orthophoto_steps(args, bounds_file_path, orthophoto_file, orthophoto_ti
         Cropper.crop(bounds_file_path, orthophoto_file, get_orthophoto_vars(args), keep_original=not args.optimize_disk_space, warp_options=['-dstalpha'])
 
     if args.build_overviews and not args.cog:
-        build_overviews(orthophoto_file)
+        build_overviews(orthophoto_file, max_workers=args.max_concurrency)
 
     if args.orthophoto_png:
         generate_png(orthophoto_file)
@@ -139,8 +143,8 @@ def compute_mask_raster(input_raster, vector_mask, output_raster, blend_distance
                     # alpha_band = rast.dataset_mask()
                     alpha_band = out_image[-1]
                     dist_t = edt(alpha_band, black_border=True, parallel=0)
-                    dist_t[dist_t <= blend_distance] /= blend_distance
-                    dist_t[dist_t > blend_distance] = 1
+                    np.divide(dist_t, blend_distance, out=dist_t)
+                    np.minimum(dist_t, 1, out=dist_t)
                     np.multiply(alpha_band, dist_t, out=alpha_band, casting="unsafe")
                 else:
                     log.ODM_WARNING("%s does not have an alpha band, cannot blend cutline!" % input_raster)
@@ -164,8 +168,8 @@ def feather_raster(input_raster, output_raster, blend_distance=20):
             if out_image.shape[0] >= 4:
                 alpha_band = out_image[-1]
                 dist_t = edt(alpha_band, black_border=True, parallel=0)
-                dist_t[dist_t <= blend_distance] /= blend_distance
-                dist_t[dist_t > blend_distance] = 1
+                np.divide(dist_t, blend_distance, out=dist_t)
+                np.minimum(dist_t, 1, out=dist_t)
                 np.multiply(alpha_band, dist_t, out=alpha_band, casting="unsafe")
             else:
                 log.ODM_WARNING("%s does not have an alpha band, cannot feather raster!" % input_raster)
@@ -13,6 +13,7 @@ from opendm import system
 from opendm import context
 from opendm import camera
 from opendm import location
+from opendm.arghelpers import double_quote
 from opendm.photo import find_largest_photo_dims, find_largest_photo
 from opensfm.large import metadataset
 from opensfm.large import tools
@@ -151,16 +152,16 @@ class OSFMContext:
             num_zero_alt = 0
             has_alt = True
             has_gps = False
+            for photo in photos:
+                if photo.altitude is None:
+                    has_alt = False
+                elif photo.altitude == 0:
+                    num_zero_alt += 1
+                if photo.latitude is not None and photo.longitude is not None:
+                    has_gps = True
+
             with open(list_path, 'w') as fout:
-                for photo in photos:
-                    if photo.altitude is None:
-                        has_alt = False
-                    elif photo.altitude == 0:
-                        num_zero_alt += 1
-                    if photo.latitude is not None and photo.longitude is not None:
-                        has_gps = True
-
-                    fout.write('%s\n' % os.path.join(images_path, photo.filename))
+                fout.write('\n'.join(os.path.join(images_path, photo.filename) for photo in photos) + '\n')
             
             # check 0 altitude images percentage when has_alt is True
             if has_alt and num_zero_alt / len(photos) > 0.05:
@@ -196,8 +197,7 @@ class OSFMContext:
             if masks:
                 log.ODM_INFO("Found %s image masks" % len(masks))
                 with open(os.path.join(self.opensfm_project_path, "mask_list.txt"), 'w') as f:
-                    for fname, mask in masks:
-                        f.write("{} {}\n".format(fname, mask))
+                    f.writelines("{} {}\n".format(fname, mask) for fname, mask in masks)
             
             # Compute feature_process_size
             feature_process_size = 2048 # default
@@ -726,6 +726,20 @@ def get_submodel_argv(args, submodels_path = None, submodel_name = None):
 
     return result
 
+def run_submodel_toolchain(argv):
+    """
+    Run the ODM toolchain on a submodel with argv from get_submodel_argv.
+    The submodel gets exactly the parent's environment: system.run only reads
+    env_vars to override its own copy, so os.environ is passed without copying it.
+    """
+    if sys.platform == 'win32':
+        # The "run" launcher can only be started through cmd.exe
+        cmd = " ".join(map(double_quote, map(str, argv)))
+    else:
+        cmd = argv
+
+    system.run(cmd, env_vars=os.environ)
+
 def get_submodel_args_dict(args):
     submodel_argv = get_submodel_argv(args)
     result = {}
@@ -748,21 +762,30 @@ def get_submodel_args_dict(args):
     return result
 
 
+def get_submodel_dirs(submodels_path):
+    """
+    :return names of all submodel directories in submodels_path.
+        Directories without an opensfm folder (e.g. from an interrupted split) are skipped.
+    """
+    if not os.path.exists(submodels_path):
+        return []
+
+    # Directory entries carry their type, no stat needed
+    with os.scandir(submodels_path) as it:
+        return [e.name for e in it if e.name.startswith('submodel') and e.is_dir() and os.path.isdir(os.path.join(e.path, "opensfm"))]
+
 def get_submodel_paths(submodels_path, *paths):
     """
     :return Existing paths for all submodels
     """
     result = []
-    if not os.path.exists(submodels_path):
-        return result
 
-    for f in os.listdir(submodels_path):
-        if f.startswith('submodel'):
-            p = os.path.join(submodels_path, f, *paths) 
-            if os.path.exists(p):
-                result.append(p)
-            else:
-                log.ODM_WARNING("Missing %s from submodel %s" % (p, f))
+    for f in get_submodel_dirs(submodels_path):
+        p = os.path.join(submodels_path, f, *paths) 
+        if os.path.exists(p):
+            result.append(p)
+        else:
+            log.ODM_WARNING("Missing %s from submodel %s" % (p, f))
 
     return result
 
@@ -776,21 +799,18 @@ def get_all_submodel_paths(submodels_path, *all_paths):
                  ["path/submodel_0001/odm_orthophoto.tif", "path/submodel_0001/dem.tif"]]
     """
     result = []
-    if not os.path.exists(submodels_path):
-        return result
 
-    for f in os.listdir(submodels_path):
-        if f.startswith('submodel'):
-            all_found = True
+    for f in get_submodel_dirs(submodels_path):
+        paths = [os.path.join(submodels_path, f, ap) for ap in all_paths]
+        all_found = True
 
-            for ap in all_paths:
-                p = os.path.join(submodels_path, f, ap) 
-                if not os.path.exists(p):
-                    log.ODM_WARNING("Missing %s from submodel %s" % (p, f))
-                    all_found = False
+        for p in paths:
+            if not os.path.exists(p):
+                log.ODM_WARNING("Missing %s from submodel %s" % (p, f))
+                all_found = False
 
-            if all_found:
-                result.append([os.path.join(submodels_path, f, ap) for ap in all_paths])
+        if all_found:
+            result.append(paths)
 
     return result
 
@@ -19,44 +19,32 @@ from xml.parsers.expat import ExpatError
 from opensfm.sensors import sensor_data
 from opensfm.geo import ecef_from_lla
 
+# Disable exifread log
+logging.getLogger('exifread').setLevel(logging.CRITICAL)
+
+# Per-photo regular expressions
+quantix_filename_re = re.compile(r"IMG_(\d+)_(\w+)\.\w+", re.IGNORECASE)
+band_name_sanitize_re = re.compile(r'[^A-Za-z0-9]+')
+lens_focal_re = re.compile(r'([\d\.]+)mm')
+
 projections = ['perspective', 'fisheye', 'fisheye_opencv', 'brown', 'dual', 'equirectangular', 'spherical']
 
 def find_largest_photo_dims(photos):
-    max_mp = 0
-    max_dims = None
-
-    for p in photos:
-        if p.width is None or p.height is None:
-            continue
-        mp = p.width * p.height
-        if mp > max_mp:
-            max_mp = mp
-            max_dims = (p.width, p.height)
-        
-    return max_dims
+    max_p = max((p for p in photos if p.width is not None and p.height is not None),
+                key=lambda p: p.width * p.height, default=None)
+
+    if max_p is not None and max_p.width * max_p.height > 0:
+        return (max_p.width, max_p.height)
 
 def find_largest_photo_dim(photos):
-    max_dim = 0
-    for p in photos:
-        if p.width is None:
-            continue
-        max_dim = max(max_dim, max(p.width, p.height))
-        
-    return max_dim
+    return max((max(p.width, p.height) for p in photos if p.width is not None), default=0)
 
 def find_largest_photo(photos):
-    max_p = None
-    max_area = 0
-    for p in photos:
-        if p.width is None:
-            continue
-        area = p.width * p.height
-
-        if area > max_area:
-            max_area = area
-            max_p = p
+    max_p = max((p for p in photos if p.width is not None),
+                key=lambda p: p.width * p.height, default=None)
 
-    return max_p
+    if max_p is not None and max_p.width * max_p.height > 0:
+        return max_p
 
 def get_mm_per_unit(resolution_unit):
     """Length of a resolution unit in millimeters.
@@ -90,6 +78,21 @@ class GPSRefMock:
 class ODM_Photo:
     """ODMPhoto - a class for ODMPhotos"""
 
+    __slots__ = ('filename', 'mask',
+                 'width', 'height', 'camera_make', 'camera_model', 'orientation',
+                 'latitude', 'longitude', 'altitude',
+                 'band_name', 'band_index', 'capture_uuid',
+                 'fnumber', 'radiometric_calibration', 'black_level', 'gain', 'gain_adjustment',
+                 'exposure_time', 'iso_speed', 'bits_per_sample', 'vignetting_center',
+                 'vignetting_polynomial', 'spectral_irradiance', 'horizontal_irradiance',
+                 'irradiance_scale_to_si', 'utc_time',
+                 'yaw', 'pitch', 'roll', 'omega', 'phi', 'kappa',
+                 'sun_sensor', 'dls_yaw', 'dls_pitch', 'dls_roll',
+                 'speed_x', 'speed_y', 'speed_z',
+                 'exif_width', 'exif_height',
+                 'gps_xy_stddev', 'gps_z_stddev',
+                 'camera_projection', 'focal_ratio')
+
     def __init__(self, path_file):
         self.filename = os.path.basename(path_file)
         self.mask = None
@@ -167,9 +170,11 @@ class ODM_Photo:
         self.parse_exif_values(path_file)
 
     def __str__(self):
-        return '{} | camera: {} {} | dimensions: {} x {} | lat: {} | lon: {} | alt: {} | band: {} ({})'.format(
-                            self.filename, self.camera_make, self.camera_model, self.width, self.height, 
-                            self.latitude, self.longitude, self.altitude, self.band_name, self.band_index)
+        return f'{self.filename} | camera: {self.camera_make} {self.camera_model} | dimensions: {self.width} x {self.height} | ' \
+               f'lat: {self.latitude} | lon: {self.longitude} | alt: {self.altitude} | band: {self.band_name} ({self.band_index})'
+
+    def to_dict(self):
+        return {k: getattr(self, k) for k in self.__slots__ if hasattr(self, k)}
 
     def set_mask(self, mask):
         self.mask = mask
@@ -189,31 +194,28 @@ class ODM_Photo:
         self.gps_z_stddev = geo_entry.vertical_accuracy
 
     def parse_exif_values(self, _path_file):
-        # Disable exifread log
-        logging.getLogger('exifread').setLevel(logging.CRITICAL)
-
-        try:
-            self.width, self.height = get_image_size.get_image_size(_path_file)
-        except Exception as e:
-            raise PhotoCorruptedException(str(e))
-
         tags = {}
         xtags = {}
 
         with open(_path_file, 'rb') as f:
+            # Read dimensions and EXIF from the same file handle
+            try:
+                self.width, self.height = get_image_size.get_image_size(f)
+            except Exception as e:
+                raise PhotoCorruptedException(str(e))
+
+            f.seek(0)
             tags = exifread.process_file(f, details=True, extract_thumbnail=False)
             try:
                 if 'Image Make' in tags:
                     try:
-                        self.camera_make = tags['Image Make'].values
-                        self.camera_make = self.camera_make.strip()
+                        self.camera_make = self.str_value(tags['Image Make'])
                     except UnicodeDecodeError:
                         log.ODM_WARNING("EXIF Image Make might be corrupted")
                         self.camera_make = "unknown"
                 if 'Image Model' in tags:
                     try:
-                        self.camera_model = tags['Image Model'].values
-                        self.camera_model = self.camera_model.strip()
+                        self.camera_model = self.str_value(tags['Image Model'])
                     except UnicodeDecodeError:
                         log.ODM_WARNING("EXIF Image Model might be corrupted")
                         self.camera_model = "unknown"
@@ -482,7 +484,7 @@ class ODM_Photo:
         # for some reason, they don't store band information in EXIFs
         if self.camera_make.lower() == 'aerovironment' and \
             self.camera_model.lower() == 'quantix':
-            matches = re.match("IMG_(\d+)_(\w+)\.\w+", self.filename, re.IGNORECASE)
+            matches = quantix_filename_re.match(self.filename)
             if matches:
                 band_aliases = {
                     'GRN': 'Green',
@@ -494,7 +496,7 @@ class ODM_Photo:
                 self.band_name = band_aliases.get(matches.group(2), matches.group(2))
 
         # Sanitize band name since we use it in folder paths
-        self.band_name = re.sub('[^A-Za-z0-9]+', '', self.band_name)
+        self.band_name = band_name_sanitize_re.sub('', self.band_name)
 
         self.compute_focal(tags, xtags)
         self.compute_opk()
@@ -533,7 +535,7 @@ class ODM_Photo:
             focal = self.float_value(tags["EXIF FocalLength"])
         if focal is None and "@aux:Lens" in xtags:
             lens = self.get_xmp_tag(xtags, ["@aux:Lens"])
-            matches = re.search('([\d\.]+)mm', str(lens))
+            matches = lens_focal_re.search(str(lens))
             if matches:
                 focal = float(matches.group(1))
 
@@ -652,6 +654,12 @@ class ODM_Photo:
         if len(v) > 0:
             return v[0]
 
+    def str_value(self, tag):
+        v = tag.values
+        if isinstance(v, bytes):
+            v = v.decode('utf8')
+        return str(v).strip()
+
     def list_values(self, tag):
         return " ".join(map(str, tag.values))
 
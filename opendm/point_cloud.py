@@ -252,8 +252,8 @@ def fast_merge_ply(input_point_cloud_files, output_file):
                     if i > 100:
                         raise IOError("Cannot find end_header field. Invalid PLY?")
                 
-                # Write fields
-                out.write(fin.read())
+                # Write fields, streaming rather than reading whole files in memory
+                shutil.copyfileobj(fin, out, 16 * 1024 * 1024)
     
     return output_file
 
@@ -12,8 +12,7 @@ from opendm import config
 from pyodm import Node, exceptions
 from pyodm.utils import AtomicCounter
 from pyodm.types import TaskStatus
-from opendm.osfm import OSFMContext, get_submodel_args_dict, get_submodel_argv
-from opendm.utils import double_quote
+from opendm.osfm import OSFMContext, get_submodel_args_dict, get_submodel_argv, run_submodel_toolchain
 
 try:
     import queue
@@ -479,7 +478,7 @@ class ToolchainTask(Task):
             argv = get_submodel_argv(config.config(), submodels_path, submodel_name)
 
             # Re-run the ODM toolchain on the submodel
-            system.run(" ".join(map(double_quote, map(str, argv))), env_vars=os.environ.copy())
+            run_submodel_toolchain(argv)
 
             # This will only get executed if the command above succeeds
             self.touch(completed_file)
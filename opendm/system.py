@@ -1,10 +1,7 @@
 import os
-import errno
-import json
 import datetime
 import sys
 import subprocess
-import string
 import signal
 import io
 import shutil
@@ -21,12 +18,6 @@ class SubprocessException(Exception):
 class ExitException(Exception):
     pass
 
-def get_ccd_widths():
-    """Return the CCD Width of the camera listed in the JSON defs file."""
-    with open(context.ccd_widths_path) as f:
-        sensor_data = json.loads(f.read())
-    return dict(zip(map(string.lower, sensor_data.keys()), sensor_data.values()))
-
 running_subprocesses = []
 cleanup_callbacks = []
 
@@ -67,11 +58,16 @@ signal.signal(signal.SIGINT, sighandler)
 signal.signal(signal.SIGTERM, sighandler)
 
 def run(cmd, env_paths=[context.superbuild_bin_path], env_vars={}, packages_paths=context.python_packages_paths, quiet=False):
-    """Run a system command"""
+    """Run a system command. cmd can be a shell command string or an
+    argv list, in which case the program is executed directly without a shell"""
     global running_subprocesses
 
+    use_shell = isinstance(cmd, str)
+    if not use_shell:
+        cmd = [str(a) for a in cmd]
+
     if not quiet:
-        log.ODM_INFO('running %s' % cmd)
+        log.ODM_INFO('running %s' % (cmd if use_shell else ' '.join(cmd)))
     env = os.environ.copy()
 
     sep = ":"
@@ -83,14 +79,18 @@ def run(cmd, env_paths=[context.superbuild_bin_path], env_vars={}, packages_path
     
     if len(packages_paths) > 0:
         env["PYTHONPATH"] = env.get("PYTHONPATH", "") + sep + sep.join(packages_paths) 
-    if sys.platform == 'darwin':
+    if sys.platform == 'darwin' and use_shell:
         # Propagate DYLD_LIBRARY_PATH
         cmd = "export DYLD_LIBRARY_PATH=\"%s\" && %s" % (env.get("DYLD_LIBRARY_PATH", ""), cmd)
 
     for k in env_vars:
         env[k] = str(env_vars[k])
 
-    p = subprocess.Popen(cmd, shell=True, env=env, start_new_session=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    try:
+        p = subprocess.Popen(cmd, shell=use_shell, env=env, start_new_session=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    except FileNotFoundError:
+        # Match the shell's behavior for a missing program
+        raise SubprocessException("Command not found: {}".format(cmd[0]), 127)
     running_subprocesses.append(p)
     lines = deque()
     for line in io.TextIOWrapper(p.stdout):
@@ -103,7 +103,7 @@ def run(cmd, env_paths=[context.superbuild_bin_path], env_vars={}, packages_path
     retcode = p.wait()
 
     if not quiet:
-        log.logger.log_json_process(cmd, retcode, list(lines))
+        log.logger.log_json_process(cmd if use_shell else ' '.join(cmd), retcode, list(lines))
 
     running_subprocesses.remove(p)
     if retcode < 0:
@@ -134,11 +134,7 @@ def benchmark(start, benchmarking_file, process):
 def mkdir_p(path):
     """Make a directory including parent directories.
     """
-    try:
-        os.makedirs(path)
-    except os.error as exc:
-        if exc.errno != errno.EEXIST or not os.path.isdir(path):
-            raise
+    os.makedirs(path, exist_ok=True)
 
 # Python2 shutil.which
 def which(program):
@@ -162,15 +158,22 @@ def move_files(src, dst):
     if not os.path.isdir(dst):
         raise IOError("Not a directory: %s" % dst)
 
-    for f in os.listdir(src):
-        if os.path.isfile(os.path.join(src, f)):
-            shutil.move(os.path.join(src, f), dst)
+    # Read the listing before changing the directory
+    with os.scandir(src) as it:
+        entries = list(it)
+
+    for entry in entries:
+        if entry.is_file():
+            shutil.move(entry.path, dst)
 
 def delete_files(folder, exclude=()):
     if not os.path.isdir(folder):
         return
 
-    for f in os.listdir(folder):
-        if os.path.isfile(os.path.join(folder, f)):
-            if not exclude or not f.endswith(exclude):
-                os.unlink(os.path.join(folder, f))
\ No newline at end of file
+    with os.scandir(folder) as it:
+        entries = list(it)
+
+    for entry in entries:
+        if entry.is_file():
+            if not exclude or not entry.name.endswith(exclude):
+                os.unlink(entry.path)
\ No newline at end of file
@@ -32,9 +32,7 @@ def extract_temperatures_dji(photo, image, dataset_tree):
             # Adding support for MAVIC2-ENTERPRISE-ADVANCED Camera images
             im = Image.open(f"{dataset_tree}/{photo.filename}")
             # concatenate APP3 chunks of data
-            a = im.applist[3][1]
-            for i in range(4, 14):
-                a += im.applist[i][1]
+            a = b''.join(im.applist[i][1] for i in range(3, 14))
             # create image from bytes
             try:
                 img = Image.frombytes("I;16L", (640, 512), a)
@@ -28,7 +28,36 @@ class ODM_Reconstruction(object):
         self.gcp = None
         self.multi_camera = self.detect_multi_camera()
         self.filter_photos()
-        
+
+    @property
+    def photos(self):
+        return self._photos
+
+    @photos.setter
+    def photos(self, photos):
+        self._photos = photos
+        self._by_filename = None
+        self._cols = None
+
+    def as_arrays(self):
+        """
+        Columnar view of the photos (filename, lat, lon, alt as NumPy arrays),
+        computed on first access and reset when photos change.
+        Missing GPS values are NaN.
+        """
+        cols = self._cols
+        if cols is None:
+            n = len(self.photos)
+            nan_or = lambda v: v if v is not None else np.nan
+            cols = {
+                'filename': np.array([p.filename for p in self.photos], dtype=object),
+                'lat': np.fromiter((nan_or(p.latitude) for p in self.photos), np.float64, n),
+                'lon': np.fromiter((nan_or(p.longitude) for p in self.photos), np.float64, n),
+                'alt': np.fromiter((nan_or(p.altitude) for p in self.photos), np.float64, n),
+            }
+            self._cols = cols
+        return cols
+
     def detect_multi_camera(self):
         """
         Looks at the reconstruction photos and determines if this
@@ -79,15 +108,23 @@ class ODM_Reconstruction(object):
                 for filename in p2s:
                     max_files_per_band = max(max_files_per_band, len(p2s[filename]))
 
+                photos_by_filename = {}
+                for p in self.photos:
+                    photos_by_filename.setdefault(p.filename, []).append(p)
+
+                photos_to_remove = []
                 for filename in p2s:
                     if len(p2s[filename]) < max_files_per_band:
-                        photos_to_remove = p2s[filename] + [p for p in self.photos if p.filename == filename]
-                        for photo in photos_to_remove:
-                            log.ODM_WARNING("Excluding %s" % photo.filename)
+                        photos_to_remove += p2s[filename] + photos_by_filename.get(filename, [])
 
-                            self.photos = [p for p in self.photos if p != photo]
-                            for i in range(len(mc)):
-                                mc[i]['photos'] = [p for p in mc[i]['photos'] if p != photo]
+                for photo in photos_to_remove:
+                    log.ODM_WARNING("Excluding %s" % photo.filename)
+
+                if photos_to_remove:
+                    photos_to_remove = set(photos_to_remove)
+                    self.photos = [p for p in self.photos if p not in photos_to_remove]
+                    for i in range(len(mc)):
+                        mc[i]['photos'] = [p for p in mc[i]['photos'] if p not in photos_to_remove]
                 
                 log.ODM_INFO("New image count: %s" % len(self.photos))
 
@@ -196,7 +233,7 @@ class ODM_Reconstruction(object):
                 # Convert GCP file to a UTM projection since the rest of the pipeline
                 # does not handle other SRS well.
                 rejected_entries = []
-                utm_gcp = GCPFile(gcp.create_utm_copy(output_gcp_file, filenames=[p.filename for p in self.photos], rejected_entries=rejected_entries, include_extras=True))
+                utm_gcp = GCPFile(gcp.create_utm_copy(output_gcp_file, filenames=set(self.as_arrays()['filename']), rejected_entries=rejected_entries, include_extras=True))
                 
                 if not utm_gcp.exists():
                     raise RuntimeError("Could not project GCP file to UTM. Please double check your GCP file for mistakes.")
@@ -242,7 +279,7 @@ class ODM_Reconstruction(object):
     def georeference_with_gps(self, images_path, output_coords_file, output_model_txt_geo, rerun=False):
         try:
             if not io.file_exists(output_coords_file) or rerun:
-                location.extract_utm_coords(self.photos, images_path, output_coords_file)
+                location.extract_utm_coords(self.as_arrays(), images_path, output_coords_file)
             else:
                 log.ODM_INFO("Coordinates file already exist: %s" % output_coords_file)
             
@@ -281,11 +318,18 @@ class ODM_Reconstruction(object):
             return (None, None)
 
     def get_photo(self, filename):
-        for p in self.photos:
-            if p.filename == filename:
-                return p
+        by_filename = self._by_filename
+        if by_filename is None:
+            # Build fully before publishing, this is called from multiple threads
+            by_filename = {}
+            for p in self.photos:
+                by_filename.setdefault(p.filename, p)
+            self._by_filename = by_filename
+        return by_filename.get(filename)
     
 class ODM_GeoRef(object):
+    __slots__ = ('srs', 'utm_east_offset', 'utm_north_offset', 'transform', '_proj4')
+
     @staticmethod
     def FromCoordsFile(coords_file):
         # check for coordinate file existence
@@ -305,8 +349,7 @@ class ODM_GeoRef(object):
             srs = location.parse_srs_header(line)
 
             # second line is a northing/easting offset
-            line = f.readline().rstrip()
-            utm_east_offset, utm_north_offset = map(float, line.split(" "))
+            utm_east_offset, utm_north_offset = map(float, f.readline().split()[:2])
 
         return ODM_GeoRef(srs, utm_east_offset, utm_north_offset)
 
@@ -315,9 +358,13 @@ class ODM_GeoRef(object):
         self.utm_east_offset = utm_east_offset
         self.utm_north_offset = utm_north_offset
         self.transform = []
+        self._proj4 = None
 
     def proj4(self):
-        return self.srs.to_proj4()
+        # Exporting from the CRS is not free and the SRS does not change
+        if self._proj4 is None:
+            self._proj4 = self.srs.to_proj4()
+        return self._proj4
     
     def utm_offset(self):
         return (self.utm_east_offset, self.utm_north_offset)
@@ -417,6 +464,8 @@ class ODM_Tree(object):
 
 
 class ODM_Stage:
+    __slots__ = ('name', 'args', 'progress', 'params', 'next_stage', 'prev_stage')
+
     def __init__(self, name, args, progress=0.0, **params):
         self.name = name
         self.args = args
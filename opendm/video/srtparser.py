@@ -4,24 +4,63 @@ import re
 
 
 def match_single(regexes, line, dtype=int):
-    if isinstance(regexes, str):
+    if isinstance(regexes, (str, re.Pattern)):
         regexes = [(regexes, dtype)]
-    
-    for i in range(len(regexes)):
-        if isinstance(regexes[i], str):
-            regexes[i] = (regexes[i], dtype)
-    
+
     try:
-        for r, transform in regexes:
-            match = re.search(r, line)
+        for r in regexes:
+            r, transform = r if isinstance(r, tuple) else (r, dtype)
+            match = r.search(line) if isinstance(r, re.Pattern) else re.search(r, line)
             if match:
                 res = match.group(1)
                 return transform(res)
     except Exception as e:
-        log.ODM_WARNING("Cannot parse SRT line \"%s\": %s", (line, str(e)))
+        log.ODM_WARNING("Cannot parse SRT line \"%s\": %s" % (line, str(e)))
 
     return None
 
+# Patterns are compiled once, they run on every line of every SRT file
+html_tag_re = re.compile(r'<[^<]+?>')
+time_range_re = re.compile(r"(\d{2}:\d{2}:\d{2},\d+) --> (\d{2}:\d{2}:\d{2},\d+)")
+
+iso_res = [
+    re.compile(r"iso : (\d+)"),
+    re.compile(r"ISO (\d+)")
+]
+
+shutter_res = [
+    re.compile(r"shutter : \d+/(\d+\.?\d*)"
+               r"SS (\d+\.?\d*)")
+]
+
+fnum_res = [
+    (re.compile(r"fnum : (\d+)"), lambda v: float(v)/100.0),
+    (re.compile(r"F/([\d\.]+)"), float),
+]
+
+focal_len_re = re.compile(r"focal_len : (\d+)")
+
+latitude_res = [
+    (re.compile(r"latitude: ([\d\.\-]+)"), lambda v: float(v) if v != 0 else None),
+    (re.compile(r"latitude : ([\d\.\-]+)"), lambda v: float(v) if v != 0 else None),
+    (re.compile(r"GPS \([\d\.\-]+,? ([\d\.\-]+),? [\d\.\-]+\)"), lambda v: float(v) if v != 0 else None),
+    (re.compile(r"RTK \([-+]?\d+\.\d+, (-?\d+\.\d+), -?\d+\)"), lambda v: float(v) if v != 0 else None),
+]
+
+longitude_res = [
+    (re.compile(r"longitude: ([\d\.\-]+)"), lambda v: float(v) if v != 0 else None),
+    (re.compile(r"longtitude : ([\d\.\-]+)"), lambda v: float(v) if v != 0 else None),
+    (re.compile(r"GPS \(([\d\.\-]+),? [\d\.\-]+,? [\d\.\-]+\)"), lambda v: float(v) if v != 0 else None),
+    (re.compile(r"RTK \((-?\d+\.\d+), [-+]?\d+\.\d+, -?\d+\)"), lambda v: float(v) if v != 0 else None),
+]
+
+altitude_res = [
+    (re.compile(r"altitude: ([\d\.\-]+)"), lambda v: float(v) if v != 0 else None),
+    (re.compile(r"GPS \([\d\.\-]+,? [\d\.\-]+,? ([\d\.\-]+)\)"), lambda v: float(v) if v != 0 else None),
+    (re.compile(r"RTK \([-+]?\d+\.\d+, [-+]?\d+\.\d+, (-?\d+)\)"), lambda v: float(v) if v != 0 else None),
+    (re.compile(r"abs_alt: ([\d\.\-]+)"), lambda v: float(v) if v != 0 else None),
+]
+
 class SrtFileParser:
     def __init__(self, filename):
         self.filename = filename
@@ -194,48 +233,18 @@ class SrtFileParser:
                     continue
 
                 # Remove html tags
-                line = re.sub('<[^<]+?>', '', line)
+                line = html_tag_re.sub('', line)
 
                 # Search this "00:00:00,000 --> 00:00:00,016"
-                match = re.search("(\d{2}:\d{2}:\d{2},\d+) --> (\d{2}:\d{2}:\d{2},\d+)", line)
+                match = time_range_re.search(line)
                 if match:
                     start = datetime.strptime(match.group(1), "%H:%M:%S,%f")
                     end = datetime.strptime(match.group(2), "%H:%M:%S,%f")
 
-                iso = match_single([
-                    "iso : (\d+)",
-                    "ISO (\d+)"
-                ], line)
-
-                shutter = match_single([
-                    "shutter : \d+/(\d+\.?\d*)"
-                    "SS (\d+\.?\d*)"
-                ], line)
-
-                fnum = match_single([
-                    ("fnum : (\d+)", lambda v: float(v)/100.0),
-                    ("F/([\d\.]+)", float),
-                ], line)
-
-                focal_len = match_single("focal_len : (\d+)", line)
-
-                latitude = match_single([
-                    ("latitude: ([\d\.\-]+)", lambda v: float(v) if v != 0 else None),
-                    ("latitude : ([\d\.\-]+)", lambda v: float(v) if v != 0 else None),
-                    ("GPS \([\d\.\-]+,? ([\d\.\-]+),? [\d\.\-]+\)", lambda v: float(v) if v != 0 else None),
-                    ("RTK \([-+]?\d+\.\d+, (-?\d+\.\d+), -?\d+\)", lambda v: float(v) if v != 0 else None),
-                ], line)
-
-                longitude = match_single([
-                    ("longitude: ([\d\.\-]+)", lambda v: float(v) if v != 0 else None),
-                    ("longtitude : ([\d\.\-]+)", lambda v: float(v) if v != 0 else None),
-                    ("GPS \(([\d\.\-]+),? [\d\.\-]+,? [\d\.\-]+\)", lambda v: float(v) if v != 0 else None),
-                    ("RTK \((-?\d+\.\d+), [-+]?\d+\.\d+, -?\d+\)", lambda v: float(v) if v != 0 else None),
-                ], line)
-
-                altitude = match_single([
-                    ("altitude: ([\d\.\-]+)", lambda v: float(v) if v != 0 else None),
-                    ("GPS \([\d\.\-]+,? [\d\.\-]+,? ([\d\.\-]+)\)", lambda v: float(v) if v != 0 else None),
-                    ("RTK \([-+]?\d+\.\d+, [-+]?\d+\.\d+, (-?\d+)\)", lambda v: float(v) if v != 0 else None),
-                    ("abs_alt: ([\d\.\-]+)", lambda v: float(v) if v != 0 else None),
-                ], line)
+                iso = match_single(iso_res, line)
+                shutter = match_single(shutter_res, line)
+                fnum = match_single(fnum_res, line)
+                focal_len = match_single(focal_len_re, line)
+                latitude = match_single(latitude_res, line)
+                longitude = match_single(longitude_res, line)
+                altitude = match_single(altitude_res, line)
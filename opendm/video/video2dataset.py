@@ -1,7 +1,6 @@
 import datetime
 from fractions import Fraction
-import io
-from math import ceil, floor
+from math import ceil, floor, gcd
 import time
 import cv2
 import os
@@ -207,12 +206,11 @@ class Video2Dataset:
         path = os.path.join(self.parameters.output,
             "{}_{}_{}.{}".format(video_info.basename, self.global_idx, self.frame_index, self.parameters.frame_format))
 
-        _, buf = cv2.imencode('.' + self.parameters.frame_format, frame)
-
         delta = datetime.timedelta(seconds=(self.frame_index / video_info.frame_rate))
         elapsed_time = datetime.datetime(1900, 1, 1) + delta
 
-        img = Image.open(io.BytesIO(buf))
+        # Hand the frame to PIL directly, so it is encoded only once (together with its EXIF)
+        img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
         
         entry = gps_coords = None
         if srt_parser is not None:
@@ -288,9 +286,18 @@ def get_video_info(input_file):
     return collections.namedtuple("VideoInfo", ["total_frames", "frame_rate", "basename"])(total_frames, frame_rate, basename)
 
 def float_to_rational(f):
+    if float(f).is_integer():
+        return (int(f), 1)
     f = Fraction(f).limit_denominator()
     return (f.numerator, f.denominator)
 
+def decimal_to_rational(f, decimals):
+    """Reduced rational for a value that has at most the given number of decimals"""
+    den = 10 ** decimals
+    num = int(round(f * den))
+    g = gcd(num, den)
+    return (num // g, den // g)
+
 def limit_files(paths, limit):
     if len(paths) <= limit:
         return paths
@@ -308,6 +315,9 @@ def limit_files(paths, limit):
 
     return to_keep
 
+# Precision of the GPS seconds written to EXIF
+SECONDS_DECIMALS = 5
+
 def to_deg(value, loc):
     """convert decimal coordinates into degrees, munutes and seconds tuple
     Keyword arguments: value is float gps-value, loc is direction list ["S", "N"] or ["W", "E"]
@@ -323,7 +333,7 @@ def to_deg(value, loc):
     deg =  int(abs_value)
     t1 = (abs_value-deg)*60
     min = int(t1)
-    sec = round((t1 - min)* 60, 5)
+    sec = round((t1 - min)* 60, SECONDS_DECIMALS)
     return (deg, min, sec, loc_value)
 
 def get_gps_location(elapsed_time, lat, lng, altitude):
@@ -331,8 +341,8 @@ def get_gps_location(elapsed_time, lat, lng, altitude):
     lat_deg = to_deg(lat, ["S", "N"])
     lng_deg = to_deg(lng, ["W", "E"])
 
-    exiv_lat = (float_to_rational(lat_deg[0]), float_to_rational(lat_deg[1]), float_to_rational(lat_deg[2]))
-    exiv_lng = (float_to_rational(lng_deg[0]), float_to_rational(lng_deg[1]), float_to_rational(lng_deg[2]))
+    exiv_lat = ((lat_deg[0], 1), (lat_deg[1], 1), decimal_to_rational(lat_deg[2], SECONDS_DECIMALS))
+    exiv_lng = ((lng_deg[0], 1), (lng_deg[1], 1), decimal_to_rational(lng_deg[2], SECONDS_DECIMALS))
 
     gps_ifd = {
         piexif.GPSIFD.GPSVersionID: (2, 0, 0, 0),
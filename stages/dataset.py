@@ -1,5 +1,6 @@
 import os
 import json
+import multiprocessing
 
 from opendm import context
 from opendm import io
@@ -18,31 +19,56 @@ from opendm.concurrency import parallel_map
 from opendm.video.video2dataset import Parameters, Video2Dataset
 
 def save_images_database(photos, database_file):
+    # Write one photo at a time rather than serializing
+    # the whole list to a string first
     with open(database_file, 'w') as f:
-        f.write(json.dumps([p.__dict__ for p in photos]))
-    
-    log.ODM_INFO("Wrote images database: %s" % database_file)
+        f.write('[')
+        for i, p in enumerate(photos):
+            if i > 0:
+                f.write(', ')
+            json.dump(p.to_dict(), f)
+        f.write(']')
 
-def load_images_database(database_file):
-    # Empty is used to create types.ODM_Photo class
-    # instances without calling __init__
-    class Empty:
-        pass
+    log.ODM_INFO("Wrote images database: %s" % database_file)
 
-    result = []
+def photo_from_dict(d, fields=frozenset(types.ODM_Photo.__slots__)):
+    # Create types.ODM_Photo class instances without calling __init__
+    p = types.ODM_Photo.__new__(types.ODM_Photo)
+    for k, v in d.items():
+        # Skip fields that are no longer part of ODM_Photo
+        if k in fields:
+            setattr(p, k, v)
+    return p
 
+def load_images_database(database_file):
     log.ODM_INFO("Loading images database: %s" % database_file)
 
     with open(database_file, 'r') as f:
-        photos_json = json.load(f)
-        for photo_json in photos_json:
-            p = Empty()
-            for k in photo_json:
-                setattr(p, k, photo_json[k])
-            p.__class__ = types.ODM_Photo
-            result.append(p)
-
-    return result
+        # Build photos while parsing, photo entries are the only JSON objects
+        return json.load(f, object_hook=photo_from_dict)
+
+def load_photo(path_file):
+    try:
+        return types.ODM_Photo(path_file)
+    except PhotoCorruptedException:
+        log.ODM_WARNING("%s seems corrupted and will not be used" % os.path.basename(path_file))
+
+def load_photos(path_files, max_workers=1):
+    """
+    Parse EXIF/XMP of all images, in parallel when possible
+    :return list of ODM_Photo (or None for corrupted images), in input order
+    """
+    if max_workers > 1 and len(path_files) > 1:
+        pool = multiprocessing.Pool(min(max_workers, len(path_files)))
+        try:
+            return pool.map(load_photo, path_files, chunksize=max(1, len(path_files) // (max_workers * 4)))
+        finally:
+            # Let workers exit on their own; terminate() would send them SIGTERM,
+            # which triggers our graceful exit handler in every child
+            pool.close()
+            pool.join()
+    else:
+        return [load_photo(f) for f in path_files]
 
 class ODMLoadDatasetStage(types.ODM_Stage):
     def process(self, args, outputs):
@@ -64,19 +90,24 @@ class ODMLoadDatasetStage(types.ODM_Stage):
             return ext.lower() in supported_extensions and pathfn[-5:] != "_mask"
 
         # Get supported images from dir
+        def list_files(in_dir):
+            with os.scandir(in_dir) as it:
+                return [e.name for e in it if e.is_file()]
+
         def get_images(in_dir):
-            entries = os.listdir(in_dir)
-            valid, rejects = [], []
-            for f in entries:
-                if valid_filename(f, context.supported_extensions):
-                    valid.append(f)
-                else:
-                    rejects.append(f)
-            return valid, rejects
+            # Sort files into images and image masks, splitting each name only once
+            images, masks = [], {}
+            for f in list_files(in_dir):
+                (pathfn, ext) = os.path.splitext(f)
+                if ext.lower() in context.supported_extensions:
+                    if pathfn[-5:] == "_mask":
+                        masks[pathfn] = f
+                    else:
+                        images.append(f)
+            return images, masks
 
         def search_video_files(in_dir):
-            entries = os.listdir(in_dir)
-            return [os.path.join(in_dir, f) for f in entries if valid_filename(f, context.supported_video_extensions)]
+            return [os.path.join(in_dir, f) for f in list_files(in_dir) if valid_filename(f, context.supported_video_extensions)]
 
         def find_mask(photo_path, masks):
             (pathfn, ext) = os.path.splitext(os.path.basename(photo_path))
@@ -151,29 +182,20 @@ class ODMLoadDatasetStage(types.ODM_Stage):
                     except Exception as e:
                         log.ODM_WARNING("Could not extract video frames: %s" % str(e))
 
-            files, rejects = get_images(images_dir)
+            files, masks = get_images(images_dir)
             if files:
                 # create ODMPhoto list
                 path_files = [os.path.join(images_dir, f) for f in files]
 
-                # Lookup table for masks
-                masks = {}
-                for r in rejects:
-                    (p, ext) = os.path.splitext(r)
-                    if p[-5:] == "_mask" and ext.lower() in context.supported_extensions:
-                        masks[p] = r
-                    
                 photos = []
+                log.ODM_INFO("Loading %s images" % len(path_files))
+                for f, p in zip(path_files, load_photos(path_files, args.max_concurrency)):
+                    if p is not None:
+                        p.set_mask(find_mask(f, masks))
+                        photos.append(p)
+
                 with open(tree.dataset_list, 'w') as dataset_list:
-                    log.ODM_INFO("Loading %s images" % len(path_files))
-                    for f in path_files:
-                        try:
-                            p = types.ODM_Photo(f)
-                            p.set_mask(find_mask(f, masks))
-                            photos.append(p)
-                            dataset_list.write(photos[-1].filename + '\n')
-                        except PhotoCorruptedException:
-                            log.ODM_WARNING("%s seems corrupted and will not be used" % os.path.basename(f))
+                    dataset_list.writelines(p.filename + '\n' for p in photos)
 
                 # Check if a geo file is available
                 if tree.odm_geo_file is not None and os.path.isfile(tree.odm_geo_file):
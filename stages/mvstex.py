@@ -1,4 +1,5 @@
 import os, shutil
+import threading
 
 from opendm import log
 from opendm import io
@@ -9,6 +10,7 @@ from opendm.multispectral import get_primary_band_name
 from opendm.photo import find_largest_photo_dim
 from opendm.objpacker import obj_pack
 from opendm.gltf import obj2glb
+from opendm.concurrency import parallel_map, get_max_memory_mb
 
 class ODMMvsTexStage(types.ODM_Stage):
     def process(self, args, outputs):
@@ -24,6 +26,7 @@ class ODMMvsTexStage(types.ODM_Stage):
 
         class nonloc:
             runs = []
+            progress = 0.0
 
         def add_run(nvm_file, primary=True, band=None):
             subdir = ""
@@ -52,8 +55,9 @@ class ODMMvsTexStage(types.ODM_Stage):
 
         if reconstruction.multi_camera:
 
+            primary_band_name = get_primary_band_name(reconstruction.multi_camera, args.primary_band)
             for band in reconstruction.multi_camera:
-                primary = band['name'] == get_primary_band_name(reconstruction.multi_camera, args.primary_band)
+                primary = band['name'] == primary_band_name
                 nvm_file = os.path.join(tree.opensfm, "undistorted", "reconstruction_%s.nvm" % band['name'].lower())
                 add_run(nvm_file, primary, band['name'].lower())
             
@@ -63,9 +67,12 @@ class ODMMvsTexStage(types.ODM_Stage):
             add_run(tree.opensfm_reconstruction_nvm)
         
         progress_per_run = 100.0 / len(nonloc.runs)
-        progress = 0.0
+        progress_lock = threading.Lock()
+
+        def texture_run(r, env_vars=None):
+            if env_vars is None:
+                env_vars = {}
 
-        for r in nonloc.runs:
             if not io.dir_exists(r['out_dir']):
                 system.mkdir_p(r['out_dir'])
 
@@ -113,7 +120,7 @@ class ODMMvsTexStage(types.ODM_Stage):
                 # mvstex creates a tmp directory, so make sure it is empty
                 if io.dir_exists(mvs_tmp_dir):
                     log.ODM_INFO("Removing old tmp directory {}".format(mvs_tmp_dir))
-                    shutil.rmtree(mvs_tmp_dir)
+                    io.async_rmtree(mvs_tmp_dir)
 
                 # run texturing binary
                 system.run('"{bin}" "{nvm_file}" "{model}" "{out_dir}" '
@@ -124,7 +131,7 @@ class ODMMvsTexStage(types.ODM_Stage):
                         '{keepUnseenFaces} '
                         '{nadirMode} '
                         '{labelingFile} '
-                        '{maxTextureSize} '.format(**kwargs))
+                        '{maxTextureSize} '.format(**kwargs), env_vars=env_vars)
 
                 if r['primary'] and (not r['nadir'] or args.skip_3dmodel):
                     # GlTF?
@@ -167,12 +174,48 @@ class ODMMvsTexStage(types.ODM_Stage):
                     nongeo_mtl = os.path.join(r['out_dir'], 'odm_textured_model.mtl')
                     shutil.copy(geo_mtl, nongeo_mtl)
 
-                progress += progress_per_run
-                self.update_progress(progress)
+                with progress_lock:
+                    nonloc.progress += progress_per_run
+                    self.update_progress(nonloc.progress)
             else:
                 log.ODM_WARNING('Found a valid ODM Texture file in: %s'
                                 % odm_textured_model_obj)
-        
+
+        # Primary runs go first, they compute the labeling files
+        for r in nonloc.runs:
+            if r['primary']:
+                texture_run(r)
+
+        # Secondary bands reuse those labels and are independent of each other,
+        # so texture them concurrently, splitting the available threads
+        secondary_runs = [r for r in nonloc.runs if not r['primary']]
+        if secondary_runs:
+            max_workers = min(len(secondary_runs), max(1, args.max_concurrency // 4))
+
+            # Each texturing process holds the mesh and all of the band's images
+            # in memory, only run as many as the available memory can fit (rough estimate)
+            if max_workers > 1:
+                photos_per_band = len(reconstruction.photos) / len(reconstruction.multi_camera)
+                mesh_size = max(os.path.getsize(r['model']) if io.file_exists(r['model']) else 0 for r in secondary_runs)
+                run_memory_mb = (photos_per_band * max_dim * max_dim * 4 + mesh_size * 4) / 1024 / 1024
+                max_workers = max(1, min(max_workers, int(get_max_memory_mb() / max(1, run_memory_mb))))
+                log.ODM_INFO("Texturing up to %s bands at a time (~%.0f MB each)" % (max_workers, run_memory_mb))
+
+            if max_workers > 1:
+                env_vars = {'OMP_NUM_THREADS': max(1, args.max_concurrency // max_workers)}
+
+                # parallel_map retries all items serially on errors, don't redo bands that completed
+                completed = set()
+                def secondary_run(r):
+                    if r['out_dir'] not in completed:
+                        texture_run(r, env_vars)
+                        completed.add(r['out_dir'])
+
+                parallel_map(secondary_run, secondary_runs, max_workers=max_workers)
+            else:
+                for r in secondary_runs:
+                    texture_run(r)
+
         if args.optimize_disk_space:
             for r in nonloc.runs:
                 if io.file_exists(r['model']):
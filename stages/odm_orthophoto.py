@@ -10,7 +10,6 @@ from opendm import orthophoto
 from opendm.osfm import is_submodel
 from opendm.concurrency import get_max_memory_mb
 from opendm.cutline import compute_cutline
-from opendm.utils import double_quote
 from opendm import pseudogeo
 from opendm.multispectral import get_primary_band_name
 
@@ -41,13 +40,13 @@ class ODMOrthoPhotoStage(types.ODM_Stage):
                 'ortho': tree.odm_orthophoto_render,
                 'corners': tree.odm_orthophoto_corners,
                 'res': 1.0 / (resolution/100.0),
-                'bands': '',
-                'depth_idx': '',
-                'inpaint': '',
-                'utm_offsets': '',
-                'a_srs': '',
-                'vars': '',
-                'gdal_configs': '--config GDAL_CACHEMAX %s' % (get_max_memory_mb() * 1024 * 1024)
+                'bands': [],
+                'depth_idx': [],
+                'inpaint': [],
+                'utm_offsets': [],
+                'a_srs': [],
+                'vars': [],
+                'gdal_configs': ['--config', 'GDAL_CACHEMAX', get_max_memory_mb() * 1024 * 1024]
             }
 
             models = []
@@ -60,13 +59,14 @@ class ODMOrthoPhotoStage(types.ODM_Stage):
             model_file = tree.odm_textured_model_obj
 
             if reconstruction.multi_camera:
+                primary_band_name = get_primary_band_name(reconstruction.multi_camera, args.primary_band)
                 for band in reconstruction.multi_camera:
-                    primary = band['name'] == get_primary_band_name(reconstruction.multi_camera, args.primary_band)
+                    primary = band['name'] == primary_band_name
                     subdir = ""
                     if not primary:
                         subdir = band['name'].lower()
                     models.append(os.path.join(base_dir, subdir, model_file))
-                kwargs['bands'] = '-bands %s' % (','.join([double_quote(b['name']) for b in reconstruction.multi_camera]))
+                kwargs['bands'] = ['-bands', ','.join([b['name'] for b in reconstruction.multi_camera])]
 
                 # If a RGB band is present, 
                 # use bit depth of the first non-RGB band
@@ -81,33 +81,35 @@ class ODMOrthoPhotoStage(types.ODM_Stage):
                         break
                 
                 if depth_idx is not None:
-                    kwargs['depth_idx'] = '-outputDepthIdx %s' % depth_idx
+                    kwargs['depth_idx'] = ['-outputDepthIdx', depth_idx]
             else:
                 models.append(os.path.join(base_dir, model_file))
 
                 # Perform edge inpainting on georeferenced RGB datasets
                 if reconstruction.is_georeferenced():
-                    kwargs['inpaint'] = "-inpaintThreshold 1.0"
+                    kwargs['inpaint'] = ['-inpaintThreshold', '1.0']
 
                 # Thermal dataset with single band
                 if reconstruction.photos[0].band_name.upper() == "LWIR":
-                    kwargs['bands'] = '-bands lwir'
+                    kwargs['bands'] = ['-bands', 'lwir']
 
-            kwargs['models'] = ','.join(map(double_quote, models))
+            kwargs['models'] = ','.join(models)
 
             if reconstruction.is_georeferenced():
                 orthophoto_vars = orthophoto.get_orthophoto_vars(args)
-                kwargs['utm_offsets'] = "-utm_north_offset %s -utm_east_offset %s" % (reconstruction.georef.utm_north_offset, reconstruction.georef.utm_east_offset)
-                kwargs['a_srs'] = "-a_srs \"%s\"" % reconstruction.georef.proj4()
-                kwargs['vars'] = ' '.join(['-co %s=%s' % (k, orthophoto_vars[k]) for k in orthophoto_vars])
+                kwargs['utm_offsets'] = ['-utm_north_offset', reconstruction.georef.utm_north_offset, '-utm_east_offset', reconstruction.georef.utm_east_offset]
+                kwargs['a_srs'] = ['-a_srs', reconstruction.georef.proj4()]
+                kwargs['vars'] = [a for k in orthophoto_vars for a in ('-co', '%s=%s' % (k, orthophoto_vars[k]))]
                 kwargs['ortho'] = tree.odm_orthophoto_tif # Render directly to final file
 
             # run odm_orthophoto
             log.ODM_INFO('Creating GeoTIFF')
-            system.run('"{odm_ortho_bin}" -inputFiles {models} '
-                       '-logFile "{log}" -outputFile "{ortho}" -resolution {res} -verbose '
-                       '-outputCornerFile "{corners}" {bands} {depth_idx} {inpaint} '
-                       '{utm_offsets} {a_srs} {vars} {gdal_configs} '.format(**kwargs), env_vars={'OMP_NUM_THREADS': args.max_concurrency})
+            system.run([kwargs['odm_ortho_bin'], '-inputFiles', kwargs['models'],
+                        '-logFile', kwargs['log'], '-outputFile', kwargs['ortho'], '-resolution', kwargs['res'], '-verbose',
+                        '-outputCornerFile', kwargs['corners']] +
+                        kwargs['bands'] + kwargs['depth_idx'] + kwargs['inpaint'] +
+                        kwargs['utm_offsets'] + kwargs['a_srs'] + kwargs['vars'] + kwargs['gdal_configs'],
+                        env_vars={'OMP_NUM_THREADS': args.max_concurrency})
 
             # Create georeferenced GeoTiff
             if reconstruction.is_georeferenced():
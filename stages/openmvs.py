@@ -28,7 +28,7 @@ class ODMOpenMVSStage(types.ODM_Stage):
         if not io.file_exists(tree.openmvs_model) or self.rerun():
             if self.rerun():
                 if io.dir_exists(tree.openmvs):
-                    shutil.rmtree(tree.openmvs)
+                    io.async_rmtree(tree.openmvs)
 
             # export reconstruction from opensfm
             openmvs_scene_file = os.path.join(tree.openmvs, "scene.mvs")
@@ -43,7 +43,7 @@ class ODMOpenMVSStage(types.ODM_Stage):
             depthmaps_dir = os.path.join(tree.openmvs, "depthmaps")
 
             if io.dir_exists(depthmaps_dir) and self.rerun():
-                shutil.rmtree(depthmaps_dir)
+                io.async_rmtree(depthmaps_dir)
 
             if not io.dir_exists(depthmaps_dir):
                 os.mkdir(depthmaps_dir)
@@ -187,7 +187,7 @@ class ODMOpenMVSStage(types.ODM_Stage):
                             else:
                                 # Just rename
                                 log.ODM_INFO("Skipped filtering, %s --> %s" % (scene_ply_unfiltered, scene_ply))
-                                os.rename(scene_ply_unfiltered, scene_ply)
+                                os.replace(scene_ply_unfiltered, scene_ply)
                     else:
                         log.ODM_WARNING("Found existing dense scene file %s" % scene_ply)
 
@@ -210,7 +210,7 @@ class ODMOpenMVSStage(types.ODM_Stage):
                         raise system.ExitException("Dense reconstruction failed. This could be due to poor georeferencing or insufficient image overlap.")
 
                     log.ODM_INFO("Skipped filtering, %s --> %s" % (scene_dense_ply, tree.openmvs_model))
-                    os.rename(scene_dense_ply, tree.openmvs_model)
+                    os.replace(scene_dense_ply, tree.openmvs_model)
 
                 # Filter all at once
                 if args.pc_filter > 0:
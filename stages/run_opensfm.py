@@ -1,7 +1,7 @@
 import sys
 import os
 import shutil
-import glob
+import json
 
 from opendm import log
 from opendm import io
@@ -16,6 +16,7 @@ from opendm import multispectral
 from opendm import thermal
 from opendm import nvm
 from opendm.photo import find_largest_photo
+from opendm.concurrency import parallel_map
 
 from opensfm.undistort import add_image_format_extension
 
@@ -43,11 +44,13 @@ class ODMOpenSfMStage(types.ODM_Stage):
             if args.optimize_disk_space:
                 for folder in ["features", "matches", "reports"]:
                     folder_path = octx.path(folder)
-                    if os.path.exists(folder_path):
-                        if os.path.islink(folder_path):
-                            os.unlink(folder_path)
-                        else:
-                            shutil.rmtree(folder_path)
+                    try:
+                        # Succeeds for symlinks (e.g. submodel features/matches)
+                        os.unlink(folder_path)
+                    except (IsADirectoryError, PermissionError):
+                        shutil.rmtree(folder_path)
+                    except FileNotFoundError:
+                        pass
 
         # If we find a special flag file for split/merge we stop right here
         if os.path.exists(octx.path("split_merge_stop_at_reconstruction.txt")):
@@ -65,6 +68,9 @@ class ODMOpenSfMStage(types.ODM_Stage):
             # being replaced below. It's an isolated use case.
 
             octx.export_stats(self.rerun())
+
+        # Features, matches and reports are not needed past this point
+        cleanup_disk_space()
         
         self.update_progress(75)
 
@@ -81,16 +87,30 @@ class ODMOpenSfMStage(types.ODM_Stage):
 
         updated_config_flag_file = octx.path('updated_config.txt')
 
-        # Make sure it's capped by the depthmap-resolution arg,
-        # since the undistorted images are used for MVS
-        outputs['undist_image_max_size'] = max(
-            gsd.image_max_size(photos, args.orthophoto_resolution, tree.opensfm_reconstruction, ignore_gsd=args.ignore_gsd, has_gcp=reconstruction.has_gcp()),
-            get_depthmap_resolution(args, photos)
-        )
+        # Reuse the value stored with the flag file, it requires
+        # loading the (potentially large) reconstruction to compute
+        undist_image_max_size = None
+        if io.file_exists(updated_config_flag_file) and not self.rerun():
+            try:
+                with open(updated_config_flag_file) as f:
+                    undist_image_max_size = json.load(f)['undist_image_max_size']
+            except (ValueError, KeyError, TypeError):
+                # Flag files from older versions have no value
+                pass
+
+        if undist_image_max_size is None:
+            # Make sure it's capped by the depthmap-resolution arg,
+            # since the undistorted images are used for MVS
+            undist_image_max_size = max(
+                gsd.image_max_size(photos, args.orthophoto_resolution, tree.opensfm_reconstruction, ignore_gsd=args.ignore_gsd, has_gcp=reconstruction.has_gcp()),
+                get_depthmap_resolution(args, photos)
+            )
+        outputs['undist_image_max_size'] = undist_image_max_size
 
         if not io.file_exists(updated_config_flag_file) or self.rerun():
-            octx.update_config({'undistorted_image_max_size': outputs['undist_image_max_size']})
-            octx.touch(updated_config_flag_file)
+            octx.update_config({'undistorted_image_max_size': undist_image_max_size})
+            with open(updated_config_flag_file, 'w') as f:
+                json.dump({'undist_image_max_size': undist_image_max_size}, f)
 
         # Undistorted images will be used for texturing / MVS
 
@@ -122,10 +142,6 @@ class ODMOpenSfMStage(types.ODM_Stage):
         def align_to_primary_band(shot_id, image):
             photo = reconstruction.get_photo(shot_id)
 
-            # No need to align if requested by user
-            if args.skip_band_alignment:
-                return image
-
             # No need to align primary
             if photo.band_name == primary_band_name:
                 return image
@@ -176,7 +192,9 @@ class ODMOpenSfMStage(types.ODM_Stage):
                 octx.add_shots_to_reconstruction(p2s)
                 octx.touch(added_shots_file)
 
-            undistort_pipeline.append(align_to_primary_band)
+            # No need to align if requested by user
+            if not args.skip_band_alignment:
+                undistort_pipeline.append(align_to_primary_band)
 
         octx.convert_and_undistort(self.rerun(), undistort_callback, image_list_override)
 
@@ -189,6 +207,9 @@ class ODMOpenSfMStage(types.ODM_Stage):
             # reconstruction.json, tracks.csv
             octx.convert_and_undistort(self.rerun(), undistort_callback, runId='primary')
 
+        # Vignette maps are only needed while undistorting
+        multispectral.clear_caches()
+
         if not io.file_exists(tree.opensfm_reconstruction_nvm) or self.rerun():
             octx.run('export_visualsfm --points')
         else:
@@ -199,16 +220,22 @@ class ODMOpenSfMStage(types.ODM_Stage):
             log.ODM_INFO("Multiple bands found")
 
             # Write NVM files for the various bands
+            nvm_tasks = []
+            band_filenames = None
             for band in reconstruction.multi_camera:
                 nvm_file = octx.path("undistorted", "reconstruction_%s.nvm" % band['name'].lower())
 
                 if not io.file_exists(nvm_file) or self.rerun():
                     img_map = {}
 
-                    if primary_band_name is None:
-                        primary_band_name = multispectral.get_primary_band_name(reconstruction.multi_camera, args.primary_band)
                     if p2s is None:
                         s2p, p2s = multispectral.compute_band_maps(reconstruction.multi_camera, primary_band_name)
+                    if band_filenames is None:
+                        # { (primary filename, band name) --> band filename }
+                        band_filenames = {}
+                        for fname in p2s:
+                            for p in p2s[fname]:
+                                band_filenames.setdefault((fname, p.band_name), p.filename)
                     
                     for fname in p2s:
                         
@@ -216,16 +243,22 @@ class ODMOpenSfMStage(types.ODM_Stage):
                         if band['name'] == primary_band_name:
                             img_map[add_image_format_extension(fname, 'tif')] = add_image_format_extension(fname, 'tif')
                         else:
-                            band_filename = next((p.filename for p in p2s[fname] if p.band_name == band['name']), None)
+                            band_filename = band_filenames.get((fname, band['name']))
 
                             if band_filename is not None:
                                 img_map[add_image_format_extension(fname, 'tif')] = add_image_format_extension(band_filename, 'tif')
                             else:
                                 log.ODM_WARNING("Cannot find %s band equivalent for %s" % (band, fname))
 
-                    nvm.replace_nvm_images(tree.opensfm_reconstruction_nvm, img_map, nvm_file)
+                    nvm_tasks.append((img_map, nvm_file))
                 else:
                     log.ODM_WARNING("Found existing NVM file %s" % nvm_file)
+
+            if nvm_tasks:
+                # Parse the source NVM once for all bands
+                nvm_cameras = nvm.load_nvm(tree.opensfm_reconstruction_nvm)
+                parallel_map(lambda t: nvm.write_nvm_with_map(nvm_cameras, *t), 
+                             nvm_tasks, max_workers=min(len(nvm_tasks), args.max_concurrency))
                     
         # Skip dense reconstruction if necessary and export
         # sparse reconstruction instead
@@ -237,17 +270,19 @@ class ODMOpenSfMStage(types.ODM_Stage):
             else:
                 log.ODM_WARNING("Found a valid PLY reconstruction in %s" % output_file)
 
-        cleanup_disk_space()
-
         if args.optimize_disk_space:
             os.remove(octx.path("tracks.csv"))
             if io.file_exists(octx.recon_backup_file()):
                 os.remove(octx.recon_backup_file())
 
-            if io.dir_exists(octx.path("undistorted", "depthmaps")):
-                files = glob.glob(octx.path("undistorted", "depthmaps", "*.npz"))
-                for f in files:
-                    os.remove(f)
+            depthmaps_dir = octx.path("undistorted", "depthmaps")
+            if io.dir_exists(depthmaps_dir):
+                with os.scandir(depthmaps_dir) as it:
+                    entries = list(it)
+
+                for entry in entries:
+                    if entry.name.endswith(".npz") and entry.is_file():
+                        os.remove(entry.path)
 
             # Keep these if using OpenMVS
             if args.fast_orthophoto:
@@ -1,9 +1,10 @@
 import os
 import shutil
 import json
+import threading
 import yaml
 from opendm import log
-from opendm.osfm import OSFMContext, get_submodel_argv, get_submodel_paths, get_all_submodel_paths
+from opendm.osfm import OSFMContext, get_submodel_argv, run_submodel_toolchain, get_submodel_dirs, get_submodel_paths, get_all_submodel_paths
 from opendm import types
 from opendm import io
 from opendm import system
@@ -11,13 +12,12 @@ from opendm import orthophoto
 from opendm.gcp import GCPFile
 from opendm.dem import pdal, utils
 from opendm.dem.merge import euclidean_merge_dems
-from opensfm.large import metadataset
+from opendm.dem.commands import compute_euclidean_map
 from opendm.cropper import Cropper
-from opendm.concurrency import get_max_memory
+from opendm.concurrency import parallel_map
 from opendm.remote import LocalRemoteExecutor
 from opendm.shots import merge_geojson_shots
 from opendm import point_cloud
-from opendm.utils import double_quote
 from opendm.tiles.tiler import generate_dem_tiles
 from opendm.cogeo import convert_to_cogeo
 from opendm import multispectral
@@ -76,8 +76,9 @@ class ODMSplitStage(types.ODM_Stage):
                 self.update_progress(20)
 
                 # Create submodels
-                if not io.dir_exists(tree.submodels_path) or self.rerun():
-                    if io.dir_exists(tree.submodels_path):
+                submodels_exist = io.dir_exists(tree.submodels_path)
+                if not submodels_exist or self.rerun():
+                    if submodels_exist:
                         log.ODM_WARNING("Removing existing submodels directory: %s" % tree.submodels_path)
                         shutil.rmtree(tree.submodels_path)
 
@@ -85,20 +86,32 @@ class ODMSplitStage(types.ODM_Stage):
                 else:
                     log.ODM_WARNING("Submodels directory already exist at: %s" % tree.submodels_path)
 
-                # Find paths of all submodels
-                mds = metadataset.MetaDataSet(tree.opensfm)
-                submodel_paths = [os.path.abspath(p) for p in mds.get_submodel_paths()]
+                # Find paths of all submodels (submodel_%04d/opensfm, see submodel_relpath_template)
+                submodel_paths = [os.path.abspath(os.path.join(tree.submodels_path, d, "opensfm")) for d in sorted(get_submodel_dirs(tree.submodels_path))]
 
-                for sp in submodel_paths:
+                # Band maps are the same for all submodels, compute them once
+                if reconstruction.multi_camera:
+                    primary_band_name = multispectral.get_primary_band_name(reconstruction.multi_camera, args.primary_band)
+                    _, p2s = multispectral.compute_band_maps(reconstruction.multi_camera, primary_band_name)
+
+                has_gcp = reconstruction.gcp and reconstruction.gcp.exists()
+
+                def setup_submodel(sp):
                     sp_octx = OSFMContext(sp)
                     submodel_images_dir = os.path.abspath(sp_octx.path("..", "images"))
 
+                    # List the submodel images once, used by both the GCP filter and the band links
+                    submodel_images = set()
+                    if (has_gcp or reconstruction.multi_camera) and io.dir_exists(submodel_images_dir):
+                        with os.scandir(submodel_images_dir) as it:
+                            submodel_images = {e.name for e in it if not e.name.startswith(".")}
+
                     # Copy filtered GCP file if needed
                     # One in OpenSfM's directory, one in the submodel project directory
-                    if reconstruction.gcp and reconstruction.gcp.exists():
+                    if has_gcp:
                         submodel_gcp_file = os.path.abspath(sp_octx.path("..", "gcp_list.txt"))
 
-                        if reconstruction.gcp.make_filtered_copy(submodel_gcp_file, submodel_images_dir):
+                        if reconstruction.gcp.make_filtered_copy(submodel_gcp_file, submodel_images_dir, image_names=submodel_images):
                             log.ODM_INFO("Copied filtered GCP file to %s" % submodel_gcp_file)
                             io.copy(submodel_gcp_file, os.path.abspath(sp_octx.path("gcp_list.txt")))
                         else:
@@ -113,16 +126,14 @@ class ODMSplitStage(types.ODM_Stage):
                     # If this is a multispectral dataset,
                     # we need to link the multispectral images
                     if reconstruction.multi_camera:
-                        submodel_images = os.listdir(submodel_images_dir)
-                        
-                        primary_band_name = multispectral.get_primary_band_name(reconstruction.multi_camera, args.primary_band)
-                        _, p2s = multispectral.compute_band_maps(reconstruction.multi_camera, primary_band_name)
                         for filename in p2s:
                             if filename in submodel_images:
                                 secondary_band_photos = p2s[filename]
                                 for p in secondary_band_photos:
                                     system.link_file(os.path.join(tree.dataset_raw, p.filename), submodel_images_dir)
 
+                parallel_map(setup_submodel, submodel_paths, max_workers=args.max_concurrency)
+
                 # Reconstruct each submodel
                 log.ODM_INFO("Dataset has been split into %s submodels. Reconstructing each submodel..." % len(submodel_paths))
                 self.update_progress(25)
@@ -135,12 +146,12 @@ class ODMSplitStage(types.ODM_Stage):
                         local_sp_octx.reconstruct(args.rolling_shutter, not args.sfm_no_partial, self.rerun())
                 else:
                     lre = LocalRemoteExecutor(args.sm_cluster, args.rolling_shutter, self.rerun())
-                    lre.set_projects([os.path.abspath(os.path.join(p, "..")) for p in submodel_paths])
+                    lre.set_projects([os.path.dirname(p) for p in submodel_paths])
                     lre.run_reconstruction()
 
                 self.update_progress(50)
 
-                remove_paths = []
+                remove_paths = set()
 
                 # Align
                 if not args.sm_no_align:
@@ -157,25 +168,34 @@ class ODMSplitStage(types.ODM_Stage):
                         unaligned_recon = sp_octx.path('reconstruction.unaligned.json')
                         main_recon = sp_octx.path('reconstruction.json')
 
-                        if io.file_exists(main_recon) and io.file_exists(unaligned_recon) and not self.rerun():
+                        # One directory listing instead of a stat per file
+                        try:
+                            with os.scandir(sp) as it:
+                                entries = {e.name for e in it if e.is_file()}
+                        except OSError:
+                            entries = set()
+
+                        has_main_recon = 'reconstruction.json' in entries
+
+                        if has_main_recon and 'reconstruction.unaligned.json' in entries and not self.rerun():
                             log.ODM_INFO("Submodel %s has already been aligned." % sp_octx.name())
                             continue
 
-                        if not io.file_exists(aligned_recon):
+                        if not 'reconstruction.aligned.json' in entries:
                             log.ODM_WARNING("Submodel %s does not have an aligned reconstruction (%s). "
                                             "This could mean that the submodel could not be reconstructed "
                                             " (are there enough features to reconstruct it?). Skipping." % (sp_octx.name(), aligned_recon))
-                            remove_paths.append(sp)
+                            remove_paths.add(sp)
                             continue
 
-                        if io.file_exists(main_recon):
-                            shutil.move(main_recon, unaligned_recon)
+                        if has_main_recon:
+                            os.replace(main_recon, unaligned_recon)
 
-                        shutil.move(aligned_recon, main_recon)
+                        os.replace(aligned_recon, main_recon)
                         log.ODM_INFO("%s is now %s" % (aligned_recon, main_recon))
 
                 # Remove invalid submodels
-                submodel_paths = [p for p in submodel_paths if not p in remove_paths]
+                submodel_paths = [p for p in submodel_paths if p not in remove_paths]
 
                 # Run ODM toolchain for each submodel
                 if local_workflow:
@@ -189,9 +209,9 @@ class ODMSplitStage(types.ODM_Stage):
                         argv = get_submodel_argv(args, tree.submodels_path, sp_octx.name())
 
                         # Re-run the ODM toolchain on the submodel
-                        system.run(" ".join(map(double_quote, map(str, argv))), env_vars=os.environ.copy())
+                        run_submodel_toolchain(argv)
                 else:
-                    lre.set_projects([os.path.abspath(os.path.join(p, "..")) for p in submodel_paths])
+                    lre.set_projects([os.path.dirname(p) for p in submodel_paths])
                     lre.run_toolchain()
 
                 # Restore max_concurrency value
@@ -215,22 +235,6 @@ class ODMMergeStage(types.ODM_Stage):
                 raise system.ExitException("We reached the merge stage, but %s folder does not exist. Something must have gone wrong at an earlier stage. Check the log and fix possible problem before restarting?" % tree.submodels_path)
                 
 
-            # Merge point clouds
-            if args.merge in ['all', 'pointcloud']:
-                if not io.file_exists(tree.odm_georeferencing_model_laz) or self.rerun():
-                    all_point_clouds = get_submodel_paths(tree.submodels_path, "odm_georeferencing", "odm_georeferenced_model.laz")
-                    
-                    try:
-                        point_cloud.merge(all_point_clouds, tree.odm_georeferencing_model_laz, rerun=self.rerun())
-                        point_cloud.post_point_cloud_steps(args, tree, self.rerun())
-                    except Exception as e:
-                        log.ODM_WARNING("Could not merge point cloud: %s (skipping)" % str(e))
-                else:
-                    log.ODM_WARNING("Found merged point cloud in %s" % tree.odm_georeferencing_model_laz)
-                
-            
-            self.update_progress(25)
-
             # Merge crop bounds
             merged_bounds_file = os.path.join(tree.odm_georeferencing, 'odm_georeferenced_model.bounds.gpkg')
             if not io.file_exists(merged_bounds_file) or self.rerun():
@@ -244,41 +248,65 @@ class ODMMergeStage(types.ODM_Stage):
                 else:
                     log.ODM_WARNING("No bounds found for any submodel.")
 
+            # Merge point clouds
+            def merge_point_clouds():
+                if args.merge in ['all', 'pointcloud']:
+                    if not io.file_exists(tree.odm_georeferencing_model_laz) or self.rerun():
+                        all_point_clouds = get_submodel_paths(tree.submodels_path, "odm_georeferencing", "odm_georeferenced_model.laz")
+                    
+                        try:
+                            point_cloud.merge(all_point_clouds, tree.odm_georeferencing_model_laz, rerun=self.rerun())
+                            point_cloud.post_point_cloud_steps(args, tree, self.rerun())
+                        except Exception as e:
+                            log.ODM_WARNING("Could not merge point cloud: %s (skipping)" % str(e))
+                    else:
+                        log.ODM_WARNING("Found merged point cloud in %s" % tree.odm_georeferencing_model_laz)
+
             # Merge orthophotos
-            if args.merge in ['all', 'orthophoto']:
-                if not io.dir_exists(tree.odm_orthophoto):
-                    system.mkdir_p(tree.odm_orthophoto)
-
-                if not io.file_exists(tree.odm_orthophoto_tif) or self.rerun():
-                    all_orthos_and_ortho_cuts = get_all_submodel_paths(tree.submodels_path,
-                        os.path.join("odm_orthophoto", "odm_orthophoto_feathered.tif"),
-                        os.path.join("odm_orthophoto", "odm_orthophoto_cut.tif"),
-                    )
-
-                    if len(all_orthos_and_ortho_cuts) > 1:
-                        log.ODM_INFO("Found %s submodels with valid orthophotos and cutlines" % len(all_orthos_and_ortho_cuts))
+            def merge_orthophotos():
+                if args.merge in ['all', 'orthophoto']:
+                    if not io.dir_exists(tree.odm_orthophoto):
+                        system.mkdir_p(tree.odm_orthophoto)
+
+                    if not io.file_exists(tree.odm_orthophoto_tif) or self.rerun():
+                        all_orthos_and_ortho_cuts = get_all_submodel_paths(tree.submodels_path,
+                            os.path.join("odm_orthophoto", "odm_orthophoto_feathered.tif"),
+                            os.path.join("odm_orthophoto", "odm_orthophoto_cut.tif"),
+                        )
+
+                        if len(all_orthos_and_ortho_cuts) > 1:
+                            log.ODM_INFO("Found %s submodels with valid orthophotos and cutlines" % len(all_orthos_and_ortho_cuts))
                         
-                        # TODO: histogram matching via rasterio
-                        # currently parts have different color tones
-
-                        if io.file_exists(tree.odm_orthophoto_tif):
-                            os.remove(tree.odm_orthophoto_tif)
-
-                        orthophoto_vars = orthophoto.get_orthophoto_vars(args)
-                        orthophoto.merge(all_orthos_and_ortho_cuts, tree.odm_orthophoto_tif, orthophoto_vars)
-                        orthophoto.post_orthophoto_steps(args, merged_bounds_file, tree.odm_orthophoto_tif, tree.orthophoto_tiles, args.orthophoto_resolution)
-                    elif len(all_orthos_and_ortho_cuts) == 1:
-                        # Simply copy
-                        log.ODM_WARNING("A single orthophoto/cutline pair was found between all submodels.")
-                        shutil.copyfile(all_orthos_and_ortho_cuts[0][0], tree.odm_orthophoto_tif)
+                            # TODO: histogram matching via rasterio
+                            # currently parts have different color tones
+
+                            try:
+                                os.remove(tree.odm_orthophoto_tif)
+                            except FileNotFoundError:
+                                pass
+
+                            orthophoto_vars = orthophoto.get_orthophoto_vars(args)
+                            orthophoto.merge(all_orthos_and_ortho_cuts, tree.odm_orthophoto_tif, orthophoto_vars)
+                            orthophoto.post_orthophoto_steps(args, merged_bounds_file, tree.odm_orthophoto_tif, tree.orthophoto_tiles, args.orthophoto_resolution)
+                        elif len(all_orthos_and_ortho_cuts) == 1:
+                            # Simply link (or copy if the filesystem does not support hard links)
+                            log.ODM_WARNING("A single orthophoto/cutline pair was found between all submodels.")
+                            try:
+                                os.remove(tree.odm_orthophoto_tif)
+                            except FileNotFoundError:
+                                pass
+                            try:
+                                os.link(all_orthos_and_ortho_cuts[0][0], tree.odm_orthophoto_tif)
+                            except OSError:
+                                shutil.copyfile(all_orthos_and_ortho_cuts[0][0], tree.odm_orthophoto_tif)
+                        else:
+                            log.ODM_WARNING("No orthophoto/cutline pairs were found in any of the submodels. No orthophoto will be generated.")
                     else:
-                        log.ODM_WARNING("No orthophoto/cutline pairs were found in any of the submodels. No orthophoto will be generated.")
-                else:
-                    log.ODM_WARNING("Found merged orthophoto in %s" % tree.odm_orthophoto_tif)
-
-            self.update_progress(75)
+                        log.ODM_WARNING("Found merged orthophoto in %s" % tree.odm_orthophoto_tif)
 
             # Merge DEMs
+            dem_vars = utils.get_dem_vars(args)
+
             def merge_dems(dem_filename, human_name):
                 if not io.dir_exists(tree.path('odm_dem')):
                     system.mkdir_p(tree.path('odm_dem'))
@@ -289,7 +317,6 @@ class ODMMergeStage(types.ODM_Stage):
                     log.ODM_INFO("Merging %ss" % human_name)
                     
                     # Merge
-                    dem_vars = utils.get_dem_vars(args)
                     eu_map_source = None # Default
 
                     # Use DSM's euclidean map for DTMs
@@ -314,13 +341,52 @@ class ODMMergeStage(types.ODM_Stage):
                         log.ODM_WARNING("Cannot merge %s, %s was not created" % (human_name, dem_file))
                 
                 else:
-                    log.ODM_WARNING("Found merged %s in %s" % (human_name, dem_filename))
-
-            if args.merge in ['all', 'dem'] and args.dsm:
-                merge_dems("dsm.tif", "DSM")
-
-            if args.merge in ['all', 'dem'] and args.dtm:
-                merge_dems("dtm.tif", "DTM")
+                    log.ODM_WARNING("Found merged %s in %s" % (human_name, dem_file))
+
+            def merge_rasters():
+                merge_orthophotos()
+                self.update_progress(75)
+
+                dem_merges = []
+                if args.merge in ['all', 'dem'] and args.dsm:
+                    dem_merges.append(("dsm.tif", "DSM"))
+
+                if args.merge in ['all', 'dem'] and args.dtm:
+                    dem_merges.append(("dtm.tif", "DTM"))
+
+                if len(dem_merges) > 1 and (not io.file_exists(tree.path("odm_dem", "dtm.tif")) or self.rerun()):
+                    # The DTM merge reuses the submodels' DSM euclidean maps,
+                    # make sure they exist before both merges run at the same time
+                    for dsm in get_submodel_paths(tree.submodels_path, "odm_dem", "dsm.tif"):
+                        compute_euclidean_map(dsm, io.related_file_path(dsm, postfix=".euclideand"), overwrite=False)
+
+                # parallel_map retries all items serially on errors, don't redo merges that completed
+                completed = set()
+                def merge_dem(m):
+                    if m not in completed:
+                        merge_dems(*m)
+                        completed.add(m)
+
+                parallel_map(merge_dem, dem_merges, max_workers=len(dem_merges))
+
+            # Point clouds and rasters are independent outputs,
+            # merge them at the same time
+            pc_errors = []
+            def merge_point_clouds_thread():
+                try:
+                    merge_point_clouds()
+                except Exception as e:
+                    pc_errors.append(e)
+
+            pc_thread = threading.Thread(target=merge_point_clouds_thread)
+            pc_thread.start()
+            try:
+                merge_rasters()
+            finally:
+                pc_thread.join()
+
+            if pc_errors:
+                raise pc_errors[0]
 
             self.update_progress(95)
 
@@ -0,0 +1,57 @@
+import unittest
+import os
+import json
+import tempfile
+from opendm import types
+from stages.dataset import save_images_database, load_images_database
+
+class TestDataset(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def make_photo(self, filename, **fields):
+        p = types.ODM_Photo.__new__(types.ODM_Photo)
+        p.filename = filename
+        for k, v in fields.items():
+            setattr(p, k, v)
+        return p
+
+    def test_images_database(self):
+        photos = [self.make_photo('DJI_0018.JPG', latitude=46.5, longitude=-91.0, width=4000, vignetting_polynomial=[1.0, 2.0]),
+                  self.make_photo('DJI_0019.JPG', latitude=None, longitude=None, band_name='RGB')]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = os.path.join(tmpdir, "images.json")
+            save_images_database(photos, db)
+
+            # Output is a regular JSON list
+            with open(db) as f:
+                self.assertEqual(len(json.load(f)), 2)
+
+            loaded = load_images_database(db)
+
+        self.assertEqual([type(p) for p in loaded], [types.ODM_Photo, types.ODM_Photo])
+        self.assertEqual([p.to_dict() for p in loaded], [p.to_dict() for p in photos])
+
+        # Fields never set are still unset
+        self.assertFalse(hasattr(loaded[1], 'width'))
+
+    def test_images_database_unknown_fields(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = os.path.join(tmpdir, "images.json")
+            with open(db, 'w') as f:
+                f.write(json.dumps([{'filename': 'a.JPG', 'removed_field': 1}]))
+
+            loaded = load_images_database(db)
+
+        self.assertEqual(loaded[0].filename, 'a.JPG')
+        self.assertFalse(hasattr(loaded[0], 'removed_field'))
+
+    def test_images_database_empty(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = os.path.join(tmpdir, "images.json")
+            save_images_database([], db)
+            self.assertEqual(load_images_database(db), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -53,6 +53,27 @@ class TestGcp(unittest.TestCase):
         self.assertTrue(copy.exists())
         self.assertEqual(copy.entries_count(), 1)
 
+    def test_filtered_copy_image_names(self):
+        gcp = GCPFile('tests/assets/gcp_latlon_valid.txt')
+
+        # Hidden files and directories do not match image names
+        images_dir = 'tests/assets/output/images'
+        os.makedirs(os.path.join(images_dir, 'DJI_0003.JPG.d'))
+        for f in ['DJI_0002.JPG', '.DJI_0003.JPG']:
+            open(os.path.join(images_dir, f), 'w').close()
+
+        copy = GCPFile(gcp.make_filtered_copy('tests/assets/output/filtered_images.txt', images_dir, min_images=1))
+        self.assertEqual([e.filename for e in copy.iter_entries()], ['DJI_0002.JPG'])
+
+        # Not enough images referenced
+        self.assertIsNone(gcp.make_filtered_copy('tests/assets/output/filtered_images.txt', images_dir, min_images=2))
+        self.assertFalse(os.path.exists('tests/assets/output/filtered_images.txt'))
+
+        # Precomputed image names are used instead of listing images_dir
+        copy = GCPFile(gcp.make_filtered_copy('tests/assets/output/filtered_images.txt', images_dir, min_images=1,
+                                              image_names={'DJI_0003.JPG'}))
+        self.assertEqual([e.filename for e in copy.iter_entries()], ['DJI_0003.JPG'])
+
     def test_null_gcp(self):
         gcp = GCPFile(None)
         self.assertFalse(gcp.exists())
@@ -0,0 +1,38 @@
+import unittest
+import os
+import shutil
+import numpy as np
+from opendm.gltf import parse_values, load_obj
+
+class TestGltf(unittest.TestCase):
+    def setUp(self):
+        if os.path.exists("tests/assets/output"):
+            shutil.rmtree("tests/assets/output")
+        os.makedirs("tests/assets/output")
+
+    def test_parse_values(self):
+        v = parse_values(["v 1 2 3\n", "v 4.5 -5 6e2 1.0\n"], 3)
+        self.assertEqual(v.dtype, np.float32)
+        self.assertEqual(v.tolist(), [[1, 2, 3], [4.5, -5, 600]])
+
+        # A single line is still two dimensional
+        self.assertEqual(parse_values(["vt 0.5 0.25\n"], 2).shape, (1, 2))
+
+        self.assertEqual(parse_values([], 3).size, 0)
+
+    def test_load_obj(self):
+        obj_path = "tests/assets/output/model.obj"
+        with open(obj_path, "w") as f:
+            f.write("v 0 0 0\nv 1 0 0\nv 0 1 0\n"
+                    "vt 0 0\nvt 1 0\nvt 0 1\n"
+                    "vn 0 0 1\n"
+                    "f 1/1/1 2/2/1 3/3/1\n")
+
+        obj = load_obj(obj_path, _info=lambda *args: None)
+        self.assertEqual(obj['vertices'].shape, (3, 3))
+        self.assertEqual(obj['uvs'].tolist(), [[0, 0], [1, 0], [0, 1]])
+        self.assertEqual(obj['normals'].tolist(), [[0, 0, 1]])
+        self.assertEqual(obj['faces'], {'_': [(0, 1, 2, 0, 1, 2, 0, 0, 0)]})
+
+if __name__ == '__main__':
+    unittest.main()
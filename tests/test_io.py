@@ -0,0 +1,46 @@
+import unittest
+import os
+import tempfile
+from opendm import io
+
+class TestIO(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def test_async_rmtree(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "openmvs")
+            os.makedirs(os.path.join(path, "depthmaps"))
+            with open(os.path.join(path, "depthmaps", "depth0000.dmap"), "w") as f:
+                f.write("test")
+
+            # Leftover of an interrupted delete from another process
+            stale = path + ".trash.1"
+            os.makedirs(os.path.join(stale, "depthmaps"))
+
+            io.async_rmtree(path + os.sep)
+
+            # The path is free as soon as the function returns
+            self.assertFalse(os.path.exists(path))
+            self.assertFalse(os.path.exists(stale))
+            os.mkdir(path)
+
+            io.join_rmtree_threads()
+            self.assertEqual(os.listdir(tmpdir), ["openmvs"])
+            self.assertEqual(io.rmtree_threads, [])
+
+    def test_find(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.mkdir(os.path.join(tmpdir, "geo.txt"))
+            with open(os.path.join(tmpdir, "gcp_list.txt"), "w") as f:
+                f.write("test")
+
+            self.assertEqual(io.find("gcp_list.txt", tmpdir), tmpdir + "/gcp_list.txt")
+
+            # Directories and missing files are not found
+            self.assertIsNone(io.find("geo.txt", tmpdir))
+            self.assertIsNone(io.find("align.laz", tmpdir))
+            self.assertIsNone(io.find("gcp_list.txt", os.path.join(tmpdir, "missing")))
+
+if __name__ == '__main__':
+    unittest.main()
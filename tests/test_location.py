@@ -0,0 +1,50 @@
+import unittest
+import os
+import shutil
+import numpy as np
+from opendm import location
+
+class TestLocation(unittest.TestCase):
+    def setUp(self):
+        if os.path.exists("tests/assets/output"):
+            shutil.rmtree("tests/assets/output")
+        os.makedirs("tests/assets/output")
+
+    def arrays(self, photos):
+        return {
+            'filename': np.array([p[0] for p in photos], dtype=object),
+            'lat': np.array([p[1] for p in photos], dtype=np.float64),
+            'lon': np.array([p[2] for p in photos], dtype=np.float64),
+            'alt': np.array([p[3] for p in photos], dtype=np.float64),
+        }
+
+    def test_extract_utm_coords(self):
+        coords_file = "tests/assets/output/coords.txt"
+        photos = self.arrays([('DJI_0002.JPG', 44.7011, -85.6132, 150.5),
+                              ('DJI_0003.JPG', np.nan, np.nan, 151.5),
+                              ('DJI_0004.JPG', 44.7010, -85.6128, np.nan)])
+        location.extract_utm_coords(photos, "tests/assets/images", coords_file)
+
+        with open(coords_file) as f:
+            lines = f.read().strip().split("\n")
+
+        self.assertEqual(lines[0], "WGS84 UTM 16N")
+        dx, dy = map(int, lines[1].split())
+        x, y = location.utm_proj(16, 'N')(-85.6132, 44.7011)
+        self.assertEqual(dx, int(np.floor((x + location.utm_proj(16, 'N')(-85.6128, 44.7010)[0]) / 2)))
+
+        # Photos without GPS are skipped, missing altitudes are 0
+        self.assertEqual(len(lines), 4)
+        ox, oy, oz = map(float, lines[2].split())
+        self.assertAlmostEqual(ox + dx, x, 6)
+        self.assertAlmostEqual(oy + dy, y, 6)
+        self.assertEqual(oz, 150.5)
+        self.assertEqual(lines[3].split()[2], "0")
+
+    def test_extract_utm_coords_no_gps(self):
+        photos = self.arrays([('DJI_0002.JPG', np.nan, np.nan, np.nan)])
+        self.assertRaises(Exception, location.extract_utm_coords, photos, "tests/assets/images", "tests/assets/output/coords.txt")
+        self.assertRaises(Exception, location.extract_utm_coords, self.arrays([]), "tests/assets/images", "tests/assets/output/coords.txt")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+import numpy as np
+from opendm import multispectral
+
+class TestMultispectral(unittest.TestCase):
+    def setUp(self):
+        multispectral.clear_caches()
+
+    def test_compute_vignette(self):
+        x, y = multispectral.pixel_grid(5, 3)
+        self.assertEqual((x.shape, y.shape), ((1, 5), (3, 1)))
+
+        polynomial = (0.001, 0.01)
+        v = multispectral.compute_vignette(5, 3, 2.0, 1.0, polynomial, False)
+        self.assertEqual((v.shape, v.dtype), ((3, 5), np.float32))
+        self.assertFalse(v.flags.writeable)
+
+        X, Y = np.meshgrid(np.arange(5), np.arange(3))
+        expected = 1.0 / np.polyval(polynomial + (1.0, ), np.hypot(X - 2.0, Y - 1.0))
+        self.assertTrue(np.allclose(v, expected))
+
+        # DJI maps are not inverted
+        v_dji = multispectral.compute_vignette(5, 3, 2.0, 1.0, polynomial, True)
+        self.assertTrue(np.allclose(v_dji, 1.0 / expected))
+
+        # Cached until cleared
+        self.assertIs(multispectral.compute_vignette(5, 3, 2.0, 1.0, polynomial, False), v)
+        multispectral.clear_caches()
+        self.assertIsNot(multispectral.compute_vignette(5, 3, 2.0, 1.0, polynomial, False), v)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import os
+import shutil
+from opendm import nvm
+
+NVM = """NVM_V3
+
+3
+undistorted/images/IMG_0001_1.tif 1200.5 0.9 0.1 0.2 0.3 10 20 30 0.01 0
+undistorted/images/IMG_0002_1.tif 1201.5 0.8 0.1 0.2 0.3 11 21 31 0.02 0
+undistorted/images/IMG_0003_1.tif 1202.5 0.7 0.1 0.2 0.3 12 22 32 0.03 0
+
+1
+1.0 2.0 3.0 255 255 255 1 0 100 -1.0 1.0
+
+0
+"""
+
+class TestNvm(unittest.TestCase):
+    def setUp(self):
+        if os.path.exists("tests/assets/output"):
+            shutil.rmtree("tests/assets/output")
+        os.makedirs("tests/assets/output")
+
+        self.nvm_file = "tests/assets/output/reconstruction.nvm"
+        with open(self.nvm_file, "w") as f:
+            f.write(NVM)
+
+    def test_load_nvm(self):
+        cameras = nvm.load_nvm(self.nvm_file)
+        self.assertEqual(len(cameras), 3)
+        self.assertEqual(cameras[0], ("undistorted/images/IMG_0001_1.tif", "1200.5 0.9 0.1 0.2 0.3 10 20 30 0.01 0"))
+
+        invalid_file = "tests/assets/output/invalid.nvm"
+        with open(invalid_file, "w") as f:
+            f.write("NVM_V2\n\n0\n")
+        self.assertRaises(Exception, nvm.load_nvm, invalid_file)
+
+    def test_write_nvm_with_map(self):
+        cameras = nvm.load_nvm(self.nvm_file)
+        img_map = {"IMG_000%s_1.tif" % i: "IMG_000%s_2.tif" % i for i in range(1, 4)}
+
+        dst = "tests/assets/output/reconstruction_green.nvm"
+        nvm.write_nvm_with_map(cameras, img_map, dst)
+
+        written = nvm.load_nvm(dst)
+        self.assertEqual([c[0] for c in written], ["undistorted/images/IMG_000%s_2.tif" % i for i in range(1, 4)])
+        self.assertEqual([c[1] for c in written], [c[1] for c in cameras])
+
+        # Points are not written
+        with open(dst) as f:
+            self.assertTrue(f.read().endswith("\n\n0\n0\n\n0"))
+
+        # Same output as replace_nvm_images
+        dst2 = "tests/assets/output/reconstruction_green2.nvm"
+        nvm.replace_nvm_images(self.nvm_file, img_map, dst2)
+        with open(dst) as f1, open(dst2) as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+        # All images must be mapped
+        del img_map["IMG_0002_1.tif"]
+        self.assertRaises(Exception, nvm.write_nvm_with_map, cameras, img_map, "tests/assets/output/partial.nvm")
+        self.assertFalse(os.path.exists("tests/assets/output/partial.nvm"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,9 @@
 import unittest
 import os
-from opendm.osfm import get_submodel_argv, get_submodel_args_dict
+import tempfile
+from unittest import mock
+from opendm import osfm
+from opendm.osfm import get_submodel_argv, get_submodel_args_dict, run_submodel_toolchain, get_submodel_dirs, get_submodel_paths
 from opendm import config
 
 class TestOSFM(unittest.TestCase):
@@ -61,5 +64,42 @@ class TestOSFM(unittest.TestCase):
         self.assertEqual(get_submodel_args_dict(args), 
             {'orthophoto-cutline': True, 'skip-3dmodel': True, 'dem-euclidean-map': True})
 
+    def test_run_submodel_toolchain(self):
+        argv = ["/code/run.py", "--project-path", "/my submodels", "submodel_0000"]
+
+        with mock.patch.object(osfm.system, 'run') as run:
+            with mock.patch.object(osfm.sys, 'platform', 'linux'):
+                run_submodel_toolchain(argv)
+            cmd = run.call_args[0][0]
+            self.assertEqual(cmd, argv)
+            self.assertIs(run.call_args[1]['env_vars'], os.environ)
+
+            # Windows needs a shell to start the "run" launcher
+            with mock.patch.object(osfm.sys, 'platform', 'win32'):
+                run_submodel_toolchain(argv)
+            cmd = run.call_args[0][0]
+            self.assertEqual(cmd, '/code/run.py --project-path "/my submodels" submodel_0000')
+            self.assertIs(run.call_args[1]['env_vars'], os.environ)
+
+    def test_get_submodel_dirs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.assertEqual(get_submodel_dirs(os.path.join(tmpdir, "missing")), [])
+
+            for d in ["submodel_0000", "submodel_0001"]:
+                os.makedirs(os.path.join(tmpdir, d, "opensfm"))
+            os.makedirs(os.path.join(tmpdir, "submodel_0000", "odm_dem"))
+            open(os.path.join(tmpdir, "submodel_0000", "odm_dem", "dsm.tif"), "w").close()
+
+            # Partial submodel from an interrupted split
+            os.makedirs(os.path.join(tmpdir, "submodel_0002"))
+
+            # Not submodels
+            os.makedirs(os.path.join(tmpdir, "other", "opensfm"))
+            open(os.path.join(tmpdir, "submodel_0003"), "w").close()
+
+            self.assertEqual(sorted(get_submodel_dirs(tmpdir)), ["submodel_0000", "submodel_0001"])
+            self.assertEqual(get_submodel_paths(tmpdir, "odm_dem", "dsm.tif"),
+                             [os.path.join(tmpdir, "submodel_0000", "odm_dem", "dsm.tif")])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,70 @@
+import unittest
+import os
+import re
+import tempfile
+from datetime import datetime
+from opendm.video.srtparser import SrtFileParser, match_single
+
+SRT = """1
+00:00:00,000 --> 00:00:00,016
+<font size="36">SrtCnt : 1, DiffTime : 16ms
+2023-01-06 18:56:48,380,821
+[iso : 3200] [shutter : 1/60.0] [fnum : 280] [ev : 0] [ct : 3925] [color_md : default] [focal_len : 240] [latitude: 46.842607] [longitude: -91.994295] [altitude: 198.000000] </font>
+
+2
+00:00:00,016 --> 00:00:01,000
+F/2.8, SS 206.14, ISO 150, EV 0, GPS (-82.6669, 27.7716, 10), D 2.80m, H 0.00m, H.S 0.00m/s, V.S 0.00m/s
+
+3
+00:00:35,000 --> 00:00:36,000
+F/6.3, SS 60, ISO 100, EV 0, RTK (120.083799, 30.213635, 28), HOME (120.084146, 30.214243, 103.55m), D 75.36m, H 76.19m
+
+"""
+
+class TestSrtParser(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def test_match_single(self):
+        self.assertEqual(match_single(r"ISO (\d+)", "F/2.8, ISO 150"), 150)
+        self.assertEqual(match_single(re.compile(r"ISO (\d+)"), "F/2.8, ISO 150"), 150)
+        self.assertEqual(match_single([(re.compile(r"F/([\d\.]+)"), float)], "F/2.8, ISO 150"), 2.8)
+        self.assertIsNone(match_single([re.compile(r"iso : (\d+)")], "F/2.8, ISO 150"))
+
+        # Conversion errors are logged, not raised
+        self.assertIsNone(match_single(re.compile(r"F/([\d\.]+)"), "F/2.8", dtype=int))
+
+    def test_parse(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            srt_file = os.path.join(tmpdir, "video.srt")
+            with open(srt_file, "w") as f:
+                f.write(SRT)
+
+            p = SrtFileParser(srt_file)
+            p.parse()
+
+        self.assertEqual(len(p.data), 3)
+
+        # DJI Mavic Air 2
+        d = p.data[0]
+        self.assertEqual(d['start'], datetime.strptime("00:00:00,000", "%H:%M:%S,%f"))
+        self.assertEqual(d['end'], datetime.strptime("00:00:00,016", "%H:%M:%S,%f"))
+        self.assertEqual(d['iso'], 3200)
+        self.assertEqual(d['fnum'], 2.8)
+        self.assertEqual(d['focal_len'], 240)
+        self.assertEqual((d['latitude'], d['longitude'], d['altitude']), (46.842607, -91.994295, 198.0))
+
+        # DJI Mavic Mini
+        d = p.data[1]
+        self.assertEqual(d['iso'], 150)
+        self.assertEqual(d['fnum'], 2.8)
+        self.assertEqual((d['latitude'], d['longitude'], d['altitude']), (27.7716, -82.6669, 10.0))
+
+        # DJI Phantom4 RTK
+        d = p.data[2]
+        self.assertEqual(d['iso'], 100)
+        self.assertEqual(d['fnum'], 6.3)
+        self.assertEqual((d['latitude'], d['longitude'], d['altitude']), (30.213635, 120.083799, 28.0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from opendm import types
 
 class ODMPhotoMock:
@@ -46,5 +47,34 @@ class TestTypes(unittest.TestCase):
         recon = types.ODM_Reconstruction(photos)
         self.assertTrue(recon.multi_camera is None)
 
+    def test_reconstruction_photo_lookup(self):
+        photos = [ODMPhotoMock(f, 'RGB', 0) for f in ['DJI_0018.JPG', 'DJI_0019.JPG']]
+        photos[0].latitude, photos[0].longitude = 46.5, -91.0
+        photos[1].latitude, photos[1].longitude = None, None
+
+        recon = types.ODM_Reconstruction(photos)
+        self.assertFalse(recon.has_geotagged_photos())
+        self.assertIs(recon.get_photo('DJI_0019.JPG'), photos[1])
+
+        # Lookup is invalidated when photos change
+        recon.photos = photos[:1]
+        self.assertTrue(recon.has_geotagged_photos())
+        self.assertIsNone(recon.get_photo('DJI_0019.JPG'))
+    def test_reconstruction_arrays(self):
+        photos = [ODMPhotoMock(f, 'RGB', 0) for f in ['DJI_0018.JPG', 'DJI_0019.JPG']]
+        photos[0].latitude, photos[0].longitude, photos[0].altitude = 46.5, -91.0, 100.0
+        photos[1].latitude, photos[1].longitude, photos[1].altitude = None, None, None
+
+        recon = types.ODM_Reconstruction(photos)
+        cols = recon.as_arrays()
+        self.assertEqual(list(cols['filename']), ['DJI_0018.JPG', 'DJI_0019.JPG'])
+        self.assertEqual((cols['lat'][0], cols['lon'][0], cols['alt'][0]), (46.5, -91.0, 100.0))
+        self.assertTrue(np.isnan(cols['lat'][1]) and np.isnan(cols['alt'][1]))
+
+        # Cached until photos change
+        self.assertIs(recon.as_arrays(), cols)
+        recon.photos = photos[:1]
+        self.assertEqual(list(recon.as_arrays()['filename']), ['DJI_0018.JPG'])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,24 @@
+import unittest
+from fractions import Fraction
+from opendm.video.video2dataset import decimal_to_rational
+
+class TestVideo2Dataset(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def test_decimal_to_rational(self):
+        self.assertEqual(decimal_to_rational(30.5, 2), (61, 2))
+        self.assertEqual(decimal_to_rational(12.3456, 4), (7716, 625))
+        self.assertEqual(decimal_to_rational(15.0, 3), (15, 1))
+        self.assertEqual(decimal_to_rational(0.0, 3), (0, 1))
+
+        # Values with more decimals are rounded
+        self.assertEqual(decimal_to_rational(1.23456, 2), (123, 100))
+
+        # Same result as a Fraction for values that fit the precision
+        for v in [45.1234, 59.9999, 0.0001]:
+            f = Fraction(v).limit_denominator(10000)
+            self.assertEqual(decimal_to_rational(v, 4), (f.numerator, f.denominator))
+
+if __name__ == '__main__':
+    unittest.main()